@@ -3,8 +3,16 @@ Módulo de Processamento de Dados
 
 Este módulo contém as funcionalidades para baixar, processar e formatar
 dados da API CoinGecko para uso no QuantConnect LEAN.
-"""
 
-from .process import CoinGeckoProcessor
+Os submódulos são carregados sob demanda, no primeiro acesso aos nomes
+exportados, para que importar o pacote não tenha custo.
+"""
 
 __all__ = ['CoinGeckoProcessor']
+
+
+def __getattr__(name):
+    if name == 'CoinGeckoProcessor':
+        from .process import CoinGeckoProcessor
+        return CoinGeckoProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
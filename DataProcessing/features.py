@@ -0,0 +1,156 @@
+"""
+Indicadores rolantes pré-calculados
+
+Calcula um conjunto configurável de indicadores sobre o preço de fechamento
+(retornos, médias móveis e volatilidade) de forma vetorizada, reaproveitando
+os valores já gravados quando novas barras são adicionadas.
+
+Nomes dos indicadores seguem o padrão <tipo>_<janela>:
+    return_N      Retorno simples em N barras
+    logreturn_N   Retorno logarítmico em N barras
+    sma_N         Média móvel simples de N barras
+    ema_N         Média móvel exponencial (span N)
+    volatility_N  Desvio padrão dos retornos logarítmicos em N barras
+"""
+
+import numpy as np
+import pandas as pd
+
+FEATURE_KINDS = ('return', 'logreturn', 'sma', 'ema', 'volatility')
+
+
+def parse_feature(name):
+    """
+    Separa o nome do indicador em tipo e janela.
+
+    Args:
+        name (str): Nome do indicador (ex: 'sma_20')
+
+    Returns:
+        tuple: (tipo, janela)
+    """
+    kind, _, window = name.rpartition('_')
+    if kind not in FEATURE_KINDS or not window.isdigit() or int(window) < 1:
+        raise ValueError(f"Indicador inválido: {name}")
+    return kind, int(window)
+
+
+def _compute(kind, window, close):
+    """Calcula um indicador sobre a série de fechamento."""
+    if kind == 'return':
+        return close.pct_change(window)
+    if kind == 'logreturn':
+        return np.log(close).diff(window)
+    if kind == 'sma':
+        return close.rolling(window).mean()
+    if kind == 'ema':
+        return close.ewm(span=window, adjust=False).mean()
+    return np.log(close).diff().rolling(window).std()
+
+
+def compute_features(close, features):
+    """
+    Calcula todos os indicadores sobre a série completa.
+
+    Args:
+        close (pandas.Series): Preços de fechamento indexados por timestamp
+        features (list): Nomes dos indicadores
+
+    Returns:
+        pandas.DataFrame: Uma coluna por indicador
+    """
+    columns = {}
+    for name in features:
+        kind, window = parse_feature(name)
+        columns[name] = _compute(kind, window, close)
+    return pd.DataFrame(columns, index=close.index)
+
+
+def update_features(close, features, previous=None):
+    """
+    Calcula os indicadores reaproveitando os valores já gravados.
+
+    A gravação anterior é alinhada por timestamp: as barras anteriores ao
+    início da nova série servem de histórico de aquecimento, e as barras
+    iniciais da nova série cujo fechamento coincide com o gravado mantêm os
+    valores salvos. Apenas as barras novas ou alteradas (e as seguintes) são
+    recalculadas, a partir do mínimo de histórico que cada indicador exige.
+
+    Args:
+        close (pandas.Series): Preços de fechamento indexados por timestamp
+        features (list): Nomes dos indicadores
+        previous (pandas.DataFrame): Gravação anterior com 'close' e indicadores
+
+    Returns:
+        pandas.DataFrame: Uma coluna por indicador
+    """
+    features = list(features)
+    close = close.sort_index()
+    if (close.empty or previous is None or previous.empty
+            or not set(features) <= set(previous.columns)):
+        return compute_features(close, features)
+
+    previous = previous.sort_index()
+    before = previous.index < close.index[0]
+    history, stored = previous[before], previous[~before]
+
+    # Barras da nova série idênticas às gravadas, a partir do início
+    n = min(len(close), len(stored))
+    same = (close.index[:n] == stored.index[:n]) & (close.to_numpy()[:n] == stored['close'].to_numpy()[:n])
+    reuse = n if same.all() else int(np.argmin(same))
+
+    new_count = len(close) - reuse
+    result = stored[features].iloc[:reuse].reindex(close.index)
+    if new_count == 0:
+        return result
+
+    combined = pd.concat([history['close'], close])
+    start = len(history) + reuse  # Posição da primeira barra a recalcular
+    if start == 0:
+        return compute_features(close, features)
+
+    for name in features:
+        kind, window = parse_feature(name)
+        if kind == 'ema':
+            # Continua a média exponencial a partir do último valor gravado
+            seed_value = pd.concat([history[name], stored[name].iloc[:reuse]]).iloc[-1]
+            if np.isnan(seed_value):
+                values = _compute(kind, window, combined)
+            else:
+                seed = combined.iloc[start - 1:].copy()
+                seed.iloc[0] = seed_value
+                values = seed.ewm(span=window, adjust=False).mean()
+        else:
+            warmup = window + 1 if kind == 'volatility' else window
+            values = _compute(kind, window, combined.iloc[max(0, start - warmup):])
+        result.iloc[reuse:, result.columns.get_loc(name)] = values.to_numpy()[-new_count:]
+    return result
+
+
+def read_features(filepaths):
+    """
+    Lê fechamento e indicadores dos arquivos de um símbolo já gravado.
+
+    Args:
+        filepaths (str | list): Caminho do arquivo CSV ou lista de blocos
+
+    Returns:
+        pandas.DataFrame: 'close' e indicadores indexados por timestamp, ou
+        DataFrame vazio se o arquivo não existir ou não tiver indicadores
+    """
+    if isinstance(filepaths, str):
+        filepaths = [filepaths]
+    try:
+        raw = pd.concat([pd.read_csv(path, header=None, dtype=str) for path in filepaths],
+                        ignore_index=True)
+    except (FileNotFoundError, ValueError, pd.errors.EmptyDataError):
+        return pd.DataFrame()
+    if raw.shape[1] <= 6 or raw[0].str.contains(' ', regex=False).any():
+        return pd.DataFrame()
+
+    df = pd.DataFrame({'close': raw[4].astype('float64').to_numpy()},
+                      index=raw[0].astype('int64').to_numpy())
+    for column in raw.columns[6:]:
+        pairs = raw[column].str.split('=', n=1)
+        df[pairs.iloc[0][0]] = pairs.str[1].astype('float64').to_numpy()
+    return df
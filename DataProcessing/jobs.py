@@ -0,0 +1,240 @@
+"""
+Execução de atualizações a partir de uma especificação de jobs
+
+Um arquivo JSON (ou YAML, se PyYAML estiver instalado) descreve os jobs:
+
+    {
+      "rate_limit_per_minute": 30,
+      "max_tasks": 200,
+      "jobs": [
+        {"name": "hot", "symbols": {"BTC": "bitcoin"}, "days": 2,
+         "quote_currencies": ["usd", "eur"],
+         "refresh_minutes": 60, "priority": 10, "quota_share": 0.7},
+        {"name": "long-tail", "top_n": 100, "days": 365,
+         "resolutions": ["daily"], "refresh_minutes": 1440,
+         "priority": 1, "quota_share": 0.3}
+      ]
+    }
+
+O agendador seleciona as tarefas vencidas (última atualização mais antiga
+que refresh_minutes), ordena por prioridade e atraso, reserva a cada job sua
+fração (quota_share) de max_tasks e usa a capacidade restante para as
+demais tarefas vencidas. max_tasks limita o número de moedas atualizadas por
+rodada, não de requisições: cada tarefa pode fazer também a requisição da
+série de câmbio (uma por moeda de cotação e resolução), e cada job top_n
+consulta o ranking de moedas. Todas as requisições respeitam o limite global
+rate_limit_per_minute.
+
+Moedas listadas em 'symbols' de algum job são omitidas dos jobs top_n, e
+cada resolução explícita grava em seu próprio subdiretório (<saída>/<resolução>),
+para que dois jobs nunca sobrescrevam o mesmo arquivo.
+
+quote_currencies (padrão ['usd']) gera também as séries em outras moedas,
+derivadas da série em USD com uma série de câmbio por moeda e rodada.
+"""
+
+import json
+import os
+import time
+from collections import namedtuple
+
+JOB_DEFAULTS = {
+    'days': 90,
+    'resolutions': [None],
+    'refresh_minutes': 1440,
+    'priority': 0,
+    'quota_share': None,
+    'output_dir': None,
+    'quote_currencies': ['usd'],
+}
+
+Task = namedtuple('Task', ['job', 'symbol', 'coin_id', 'days', 'resolution', 'output_dir', 'priority', 'staleness',
+                           'quote_currencies'], defaults=[('usd',)])
+
+
+def load_spec(path):
+    """
+    Lê e valida um arquivo de especificação de jobs.
+
+    Args:
+        path (str): Caminho do arquivo .json, .yaml ou .yml
+
+    Returns:
+        dict: Especificação com os valores padrão aplicados
+    """
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("Instale PyYAML para usar especificações YAML (pip install pyyaml)")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+
+    jobs = []
+    for i, job in enumerate(spec.get('jobs', [])):
+        job = {**JOB_DEFAULTS, **job}
+        job.setdefault('name', f"job{i}")
+        if ('symbols' in job) == ('top_n' in job):
+            raise ValueError(f"Job {job['name']}: informe 'symbols' ou 'top_n'")
+        if not isinstance(job['resolutions'], list):
+            job['resolutions'] = [job['resolutions']]
+        jobs.append(job)
+
+    spec['jobs'] = jobs
+    spec.setdefault('rate_limit_per_minute', 30)
+    spec.setdefault('max_tasks', None)
+    spec.setdefault('state_file', f"{os.path.splitext(path)[0]}.state.json")
+    return spec
+
+
+def task_key(task):
+    """Identificador persistente de uma tarefa no arquivo de estado."""
+    return f"{task.symbol}:{task.resolution or 'auto'}:{task.output_dir or ''}"
+
+
+def read_state(path):
+    """Lê o horário (epoch em segundos) da última atualização de cada tarefa."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def write_state(path, state):
+    """Grava o estado por substituição, sem deixar versões parciais."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def build_tasks(spec, processor, state, now):
+    """
+    Expande os jobs em tarefas vencidas, ordenadas por prioridade e atraso.
+
+    Args:
+        spec (dict): Especificação carregada por load_spec
+        processor (CoinGeckoProcessor): Usado para resolver regras top_n
+        state (dict): Última atualização de cada tarefa
+        now (float): Horário atual em epoch (segundos)
+
+    Returns:
+        list: Tarefas vencidas, da mais urgente para a menos urgente
+    """
+    # Moedas com job próprio não são repetidas nos jobs top_n
+    listed = {symbol for job in spec['jobs'] for symbol in job.get('symbols') or {}}
+
+    tasks = []
+    for job in spec['jobs']:
+        symbols = job.get('symbols')
+        if symbols is None:
+            top = processor.fetch_top_coins(job['top_n']) or {}
+            symbols = {symbol: coin_id for symbol, coin_id in top.items() if symbol not in listed}
+
+        for symbol, coin_id in symbols.items():
+            for resolution in job['resolutions']:
+                output_dir = job['output_dir']
+                if resolution:
+                    output_dir = os.path.join(output_dir or processor.output_dir, resolution)
+                task = Task(job['name'], symbol, coin_id, job['days'], resolution,
+                            output_dir, job['priority'], 0.0, tuple(job['quote_currencies']))
+                # Atraso relativo: 1.0 significa vencida há exatamente um período
+                age = now - state.get(task_key(task), 0)
+                staleness = age / (job['refresh_minutes'] * 60)
+                if staleness >= 1:
+                    tasks.append(task._replace(staleness=staleness))
+
+    tasks.sort(key=lambda task: (-task.priority, -task.staleness))
+    return tasks
+
+
+def schedule(tasks, spec):
+    """
+    Seleciona as tarefas da execução respeitando as frações de cada job.
+
+    Cada job tem reservada a fração quota_share de max_tasks; a capacidade
+    não usada é distribuída às tarefas restantes em ordem de urgência.
+
+    Args:
+        tasks (list): Tarefas ordenadas por build_tasks
+        spec (dict): Especificação carregada por load_spec
+
+    Returns:
+        list: Tarefas a executar, em ordem
+    """
+    budget = spec['max_tasks']
+    if budget is None or budget >= len(tasks):
+        return list(tasks)
+
+    quotas = {job['name']: int(budget * job['quota_share'])
+              for job in spec['jobs'] if job['quota_share']}
+    selected, remaining = [], []
+    for task in tasks:
+        if quotas.get(task.job, 0) > 0 and len(selected) < budget:
+            quotas[task.job] -= 1
+            selected.append(task)
+        else:
+            remaining.append(task)
+
+    # Capacidade ociosa: completa com as demais tarefas vencidas
+    selected += remaining[:budget - len(selected)]
+    order = {id(task): i for i, task in enumerate(tasks)}
+    return sorted(selected, key=lambda task: order[id(task)])
+
+
+def run_jobs(spec_path, processor=None, now=None, dry_run=False):
+    """
+    Executa uma rodada de atualização a partir de um arquivo de jobs.
+
+    Args:
+        spec_path (str): Caminho da especificação
+        processor (CoinGeckoProcessor): Processador a usar (padrão: novo)
+        now (float): Horário atual em epoch (padrão: time.time())
+        dry_run (bool): Apenas lista as tarefas, sem requisições de dados
+
+    Returns:
+        list: Tarefas executadas (ou planejadas, em dry_run)
+    """
+    from DataProcessing.process import CoinGeckoProcessor
+
+    spec = load_spec(spec_path)
+    processor = processor or CoinGeckoProcessor()
+    processor.request_delay = 60 / spec['rate_limit_per_minute']
+    if spec.get('output_dir'):
+        processor.output_dir = spec['output_dir']
+    default_output_dir = processor.output_dir
+
+    now = time.time() if now is None else now
+    state = read_state(spec['state_file'])
+    tasks = schedule(build_tasks(spec, processor, state, now), spec)
+
+    for task in tasks:
+        print(f"📋 [{task.job}] {task.symbol} ({task.coin_id}) "
+              f"prioridade={task.priority} atraso={task.staleness:.1f}")
+    if dry_run:
+        return tasks
+
+    done = []
+    fx_cache = {}
+    for task in tasks:
+        try:
+            processor.output_dir = task.output_dir or default_output_dir
+            raw_data = processor.fetch_data(task.coin_id, task.days, interval=task.resolution)
+            df = processor.process_data(raw_data, task.symbol)
+            if df.empty:
+                continue
+            fx_rates = processor.fetch_quote_rates(task.quote_currencies, task.days, fx_cache,
+                                                   interval=task.resolution)
+            processor.save_quotes(df, task.symbol, fx_rates, task.quote_currencies)
+            state[task_key(task)] = time.time()
+            write_state(spec['state_file'], state)
+            done.append(task)
+        except Exception as e:
+            print(f"❌ [{task.job}] Erro ao processar {task.symbol}: {e}")
+
+    processor.output_dir = default_output_dir
+    print(f"🎉 {len(done)}/{len(tasks)} tarefas concluídas")
+    return done
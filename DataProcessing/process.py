@@ -6,16 +6,18 @@ Versão corrigida com tratamento de erros e dados de exemplo
 
 import sys
 import os
-import requests
-import pandas as pd
 import time
-import random
-from datetime import datetime, timedelta
 
-# Corrigir importações - adicionar diretório pai ao path
+# Dependências pesadas (requests, pandas, numpy) são importadas sob demanda
+# nos métodos que as usam, para que importar este módulo seja imediato
+
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+
+# Executado diretamente (python DataProcessing/process.py): o diretório pai
+# precisa estar no path para encontrar config.py e o pacote DataProcessing
+if not __package__:
+    sys.path.insert(0, parent_dir)
 
 # Configurações padrão (fallback caso config.py não exista)
 CRYPTO_SYMBOLS = {
@@ -28,17 +30,30 @@ CRYPTO_SYMBOLS = {
 
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
 PROCESSED_DATA_DIR = os.path.join(parent_dir, "output")
+DEFAULT_VS_CURRENCY = "usd"
+QUOTE_CURRENCIES = ["usd"]
+FX_REFERENCE_COIN = "tether"
+FEATURES = []
+CHUNKED_STORAGE = False
 
 # Tentar importar configurações do config.py
 try:
+    import config
     from config import (
         CRYPTO_SYMBOLS,
         COINGECKO_BASE_URL, 
-        PROCESSED_DATA_DIR
+        PROCESSED_DATA_DIR,
+        DEFAULT_VS_CURRENCY
     )
-    print("✅ Configurações carregadas do config.py")
+    # Opções mais recentes: um config.py antigo sem elas usa apenas o padrão
+    # da opção ausente, mantendo as demais configurações do usuário
+    QUOTE_CURRENCIES = getattr(config, 'QUOTE_CURRENCIES', QUOTE_CURRENCIES)
+    FX_REFERENCE_COIN = getattr(config, 'FX_REFERENCE_COIN', FX_REFERENCE_COIN)
+    FEATURES = getattr(config, 'FEATURES', FEATURES)
+    CHUNKED_STORAGE = getattr(config, 'CHUNKED_STORAGE', CHUNKED_STORAGE)
+    CONFIG_LOADED = True
 except ImportError:
-    print("⚠️  Usando configurações padrão (config.py não encontrado)")
+    CONFIG_LOADED = False
 
 class CoinGeckoProcessor:
     """Processador para baixar e formatar dados OHLCV da API CoinGecko."""
@@ -46,6 +61,8 @@ class CoinGeckoProcessor:
     def __init__(self):
         self.base_url = COINGECKO_BASE_URL
         self.output_dir = PROCESSED_DATA_DIR
+        # Blocos mensais endereçados por conteúdo em vez de um arquivo único
+        self.chunked = CHUNKED_STORAGE
         
         # Headers para a API (adicione sua chave se tiver)
         self.headers = {
@@ -57,25 +74,32 @@ class CoinGeckoProcessor:
         # Rate limiting
         self.request_delay = 3  # segundos entre requisições
 
-    def fetch_data(self, coin_id, days=90):
+    def fetch_data(self, coin_id, days=90, vs_currency=DEFAULT_VS_CURRENCY, interval=None):
         """
         Busca dados OHLC da API CoinGecko.
         
         Args:
             coin_id (str): ID da moeda na CoinGecko (ex: 'bitcoin')
             days (int): Número de dias de histórico
+            vs_currency (str): Moeda de cotação (ex: 'usd', 'eur', 'btc')
+            interval (str): Resolução ('daily' ou 'hourly'); None usa a
+                granularidade automática da API
         
         Returns:
             list: Lista de dados OHLC ou None se houver erro
         """
+        import requests
+
         url = f"{self.base_url}/coins/{coin_id}/ohlc"
         params = {
-            'vs_currency': 'usd',
+            'vs_currency': vs_currency,
             'days': days
         }
+        if interval:
+            params['interval'] = interval
         
         try:
-            print(f"🔄 Buscando dados para {coin_id}...")
+            print(f"🔄 Buscando dados para {coin_id} ({vs_currency})...")
             
             # Rate limiting
             time.sleep(self.request_delay)
@@ -101,10 +125,43 @@ class CoinGeckoProcessor:
             print(f"❌ Erro ao buscar dados para {coin_id}: {e}")
             return None
 
+    def fetch_top_coins(self, limit):
+        """
+        Busca as maiores moedas por capitalização de mercado.
+        
+        Args:
+            limit (int): Número de moedas (máximo de 250 por página da API)
+        
+        Returns:
+            dict: Mapeamento símbolo -> ID CoinGecko, ou None se houver erro
+        """
+        import requests
+
+        url = f"{self.base_url}/coins/markets"
+        params = {
+            'vs_currency': DEFAULT_VS_CURRENCY,
+            'order': 'market_cap_desc',
+            'per_page': limit,
+            'page': 1
+        }
+
+        try:
+            time.sleep(self.request_delay)
+            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response.raise_for_status()
+            return {coin['symbol'].upper(): coin['id'] for coin in response.json()}
+
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Erro ao buscar as {limit} maiores moedas: {e}")
+            return None
+
     def process_data(self, raw_data, symbol):
         """
         Processa dados brutos da API para formato LEAN.
         
+        O índice é mantido como timestamp UTC em milissegundos (int64), sem
+        conversão para o fuso horário local da máquina.
+        
         Args:
             raw_data (list): Dados brutos da API CoinGecko
             symbol (str): Símbolo da criptomoeda (ex: 'BTC')
@@ -112,37 +169,48 @@ class CoinGeckoProcessor:
         Returns:
             pandas.DataFrame: DataFrame processado
         """
+        import pandas as pd
+
         if not raw_data:
             return pd.DataFrame()
 
-        processed_data = []
-        
-        for entry in raw_data:
-            timestamp = entry[0]  # Timestamp em milliseconds
-            open_price = entry[1]
-            high_price = entry[2] 
-            low_price = entry[3]
-            close_price = entry[4]
-            
-            # Converter timestamp para datetime
-            dt = datetime.fromtimestamp(timestamp / 1000)
-            
-            processed_data.append({
-                'timestamp': dt,
-                'open': open_price,
-                'high': high_price,
-                'low': low_price,
-                'close': close_price,
-                'volume': 0  # CoinGecko OHLC não inclui volume
-            })
-        
-        df = pd.DataFrame(processed_data)
+        # Cada entrada: [timestamp em milissegundos, open, high, low, close]
+        df = pd.DataFrame(
+            [entry[:5] for entry in raw_data],
+            columns=['timestamp', 'open', 'high', 'low', 'close']
+        )
+        df['timestamp'] = df['timestamp'].astype('int64')
+        df['volume'] = 0  # CoinGecko OHLC não inclui volume
         df.set_index('timestamp', inplace=True)
         df.sort_index(inplace=True)
         
         print(f"📊 Dados processados para {symbol}: {len(df)} registros")
         return df
 
+    @staticmethod
+    def to_epoch_ms(index):
+        """
+        Converte um índice de tempo para timestamps UTC em milissegundos.
+        
+        Índices inteiros já estão em milissegundos; índices de data sem fuso
+        horário são interpretados como UTC.
+        
+        Args:
+            index (pandas.Index): Índice do DataFrame
+        
+        Returns:
+            numpy.ndarray: Timestamps int64 em milissegundos
+        """
+        import pandas as pd
+
+        if pd.api.types.is_integer_dtype(index):
+            return index.to_numpy(dtype='int64')
+
+        index = pd.DatetimeIndex(index)
+        if index.tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        return index.values.astype('datetime64[ms]').astype('int64')
+
     def save_to_csv(self, df, symbol):
         """
         Salva DataFrame no formato CSV compatível com LEAN.
@@ -151,27 +219,276 @@ class CoinGeckoProcessor:
             df (pandas.DataFrame): DataFrame com dados processados
             symbol (str): Símbolo da criptomoeda
         """
+        import numpy as np
+        from DataProcessing.storage import remove_chunks, write_chunks
+
         if df.empty:
             print(f"⚠️  Nenhum dado para salvar para {symbol}")
             return
 
         # Criar diretório de saída
-        symbol_dir = os.path.join(self.output_dir, symbol.lower())
-        os.makedirs(symbol_dir, exist_ok=True)
-        
-        # Caminho do arquivo
-        filename = f"{symbol.lower()}.csv"
-        filepath = os.path.join(symbol_dir, filename)
+        filepath = self.symbol_filepath(symbol)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        # Converter para formato LEAN: YYYYMMDD HH:MM,open,high,low,close,volume
-        with open(filepath, 'w') as f:
-            for timestamp, row in df.iterrows():
-                date_str = timestamp.strftime('%Y%m%d %H:%M')
-                line = f"{date_str},{row['open']},{row['high']},{row['low']},{row['close']},{row['volume']}\n"
-                f.write(line)
+        # Formato: timestamp UTC em milissegundos,open,high,low,close,volume
+        # seguido de colunas nome=valor para cada indicador pré-calculado
+        price_columns = ['open', 'high', 'low', 'close', 'volume']
+        out = df[price_columns].copy()
+        for name in df.columns.difference(price_columns, sort=False):
+            out[name] = np.char.add(f"{name}=", df[name].to_numpy(dtype='float64').astype(str))
+        out.index = self.to_epoch_ms(df.index)
+
+        if self.chunked:
+            out.sort_index(inplace=True)
+            written, total = write_chunks(out, os.path.dirname(filepath), symbol)
+            # Arquivo único de uma gravação anterior não fica desatualizado ao lado
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            print(f"💾 Dados para {symbol}: {written}/{total} blocos gravados")
+            return
+
+        out.to_csv(filepath, header=False, lineterminator='\n')
+        # Manifesto e blocos de uma gravação anterior teriam prioridade na leitura
+        remove_chunks(os.path.dirname(filepath), symbol)
         
         print(f"💾 Dados para {symbol} salvos em {filepath}")
 
+    def symbol_filepath(self, symbol):
+        """
+        Retorna o caminho do arquivo CSV de um símbolo.
+        
+        Args:
+            symbol (str): Símbolo da criptomoeda
+        
+        Returns:
+            str: Caminho <output_dir>/<símbolo>/<símbolo>.csv
+        """
+        return os.path.join(self.output_dir, symbol.lower(), f"{symbol.lower()}.csv")
+
+    def stored_files(self, symbol):
+        """
+        Lista os arquivos atualmente gravados para um símbolo.
+        
+        Args:
+            symbol (str): Símbolo da criptomoeda
+        
+        Returns:
+            list: Blocos do manifesto, ou o arquivo único se não houver manifesto
+        """
+        from DataProcessing.storage import chunk_paths, manifest_path
+
+        symbol_dir = os.path.dirname(self.symbol_filepath(symbol))
+        chunks = chunk_paths(manifest_path(symbol_dir, symbol))
+        return chunks or [self.symbol_filepath(symbol)]
+
+    def add_features(self, df, symbol, features=None):
+        """
+        Adiciona indicadores rolantes pré-calculados como colunas extras.
+        
+        Etapa opcional executada antes de save_to_csv: reaproveita os valores
+        já gravados no arquivo do símbolo e calcula apenas as barras novas.
+        
+        Args:
+            df (pandas.DataFrame): DataFrame com dados processados
+            symbol (str): Símbolo da criptomoeda
+            features (list): Indicadores a calcular (padrão: FEATURES)
+        
+        Returns:
+            pandas.DataFrame: DataFrame com as colunas dos indicadores
+        """
+        from DataProcessing.features import read_features, update_features
+
+        features = FEATURES if features is None else features
+        if df.empty or not features:
+            return df
+
+        close = df['close'].copy()
+        close.index = self.to_epoch_ms(df.index)
+        previous = read_features(self.stored_files(symbol))
+        values = update_features(close, features, previous)
+        values.index = df.index
+        return df.join(values)
+
+    def fetch_fx_rates(self, quote_currency, days=90, interval=None):
+        """
+        Busca a série de taxas de câmbio USD -> moeda de cotação.
+        
+        Usa o preço da moeda de referência (FX_REFERENCE_COIN, atrelada ao
+        dólar) cotado na moeda de destino, com uma única requisição por moeda
+        de cotação, independentemente de quantas moedas serão convertidas.
+        
+        Args:
+            quote_currency (str): Moeda de cotação (ex: 'eur', 'btc')
+            days (int): Número de dias de histórico
+            interval (str): Resolução ('daily' ou 'hourly'), a mesma das
+                séries que serão convertidas; None usa a granularidade automática
+        
+        Returns:
+            list: Lista de pares [timestamp, taxa] ou None se houver erro
+        """
+        return self.fetch_data(FX_REFERENCE_COIN, days, vs_currency=quote_currency, interval=interval)
+
+    def process_fx_rates(self, raw_data):
+        """
+        Processa a série bruta de câmbio para uma Series indexada por tempo.
+        
+        Args:
+            raw_data (list): Dados OHLC brutos da moeda de referência
+        
+        Returns:
+            pandas.Series: Taxa (fechamento) indexada por timestamp
+        """
+        import pandas as pd
+
+        df = self.process_data(raw_data, FX_REFERENCE_COIN.upper())
+        if df.empty:
+            return pd.Series(dtype='float64')
+        return df['close'].rename('rate')
+
+    def derive_quote(self, df, rates):
+        """
+        Deriva a série OHLC em outra moeda a partir da série em USD.
+        
+        As taxas são alinhadas por timestamp (última taxa conhecida em cada
+        barra) e multiplicadas de forma vetorizada sobre as colunas de preço.
+        O volume é mantido, pois está expresso na moeda base. Barras anteriores
+        à primeira taxa disponível são descartadas.
+        
+        Args:
+            df (pandas.DataFrame): DataFrame processado em USD
+            rates (pandas.Series): Taxas USD -> moeda de cotação
+        
+        Returns:
+            pandas.DataFrame: DataFrame com preços na moeda de cotação
+        """
+        import pandas as pd
+
+        if df.empty or rates.empty:
+            return pd.DataFrame()
+
+        rates = rates.sort_index()
+        aligned = rates.reindex(df.index, method='ffill')
+
+        # Barras anteriores à primeira taxa conhecida não têm cotação
+        missing = aligned.isna().to_numpy()
+        if missing.any():
+            print(f"⚠️  {int(missing.sum())} barras sem taxa de câmbio descartadas")
+            df, aligned = df[~missing], aligned[~missing]
+        aligned = aligned.to_numpy()
+
+        derived = df.copy()
+        price_columns = ['open', 'high', 'low', 'close']
+        derived[price_columns] = df[price_columns].to_numpy() * aligned[:, None]
+        return derived
+
+    @staticmethod
+    def quote_symbol(symbol, quote_currency):
+        """
+        Retorna o símbolo usado para gravar a série em uma moeda de cotação.
+        
+        A série em USD mantém o símbolo original (ex: 'BTC'); as demais
+        recebem o sufixo da moeda (ex: 'BTCEUR'), gerando um caminho próprio
+        que o CoinGeckoData resolve pelo valor do símbolo.
+        
+        Args:
+            symbol (str): Símbolo da criptomoeda (ex: 'BTC')
+            quote_currency (str): Moeda de cotação (ex: 'eur')
+        
+        Returns:
+            str: Símbolo da série (ex: 'BTCEUR')
+        """
+        if quote_currency.lower() == DEFAULT_VS_CURRENCY:
+            return symbol
+        return f"{symbol}{quote_currency.upper()}"
+
+    def fetch_quote_rates(self, quote_currencies, days=90, cache=None, interval=None):
+        """
+        Busca uma série de câmbio por moeda de cotação diferente de USD.
+        
+        Args:
+            quote_currencies (list): Moedas de cotação (ex: ['usd', 'eur'])
+            days (int): Número de dias de histórico
+            cache (dict): Séries já buscadas, por (moeda, days, interval),
+                reaproveitadas entre chamadas
+            interval (str): Resolução das séries a converter (ver fetch_data)
+        
+        Returns:
+            dict: Mapeamento moeda -> pandas.Series de taxas
+        """
+        cache = {} if cache is None else cache
+        fx_rates = {}
+        for quote in quote_currencies:
+            quote = quote.lower()
+            if quote == DEFAULT_VS_CURRENCY:
+                continue
+            key = (quote, days, interval)
+            if key not in cache:
+                rates = self.process_fx_rates(self.fetch_fx_rates(quote, days, interval))
+                if rates.empty:
+                    print(f"⚠️  Taxas indisponíveis para {quote.upper()}, cotação ignorada")
+                cache[key] = rates
+            if not cache[key].empty:
+                fx_rates[quote] = cache[key]
+        return fx_rates
+
+    def save_quotes(self, df, symbol, fx_rates, quote_currencies=None):
+        """
+        Salva a série em USD e as séries derivadas nas demais cotações.
+        
+        A cotação igual à própria moeda (ex: BTC em BTC) é ignorada.
+        
+        Args:
+            df (pandas.DataFrame): DataFrame processado em USD
+            symbol (str): Símbolo da criptomoeda
+            fx_rates (dict): Taxas por moeda, de fetch_quote_rates
+            quote_currencies (list): Moedas de cotação (padrão: QUOTE_CURRENCIES)
+        
+        Returns:
+            int: Número de séries salvas
+        """
+        quote_currencies = [q.lower() for q in (quote_currencies or QUOTE_CURRENCIES)]
+        saved = 0
+        if DEFAULT_VS_CURRENCY in quote_currencies:
+            self.save_to_csv(self.add_features(df, symbol), symbol)
+            saved += 1
+
+        for quote in quote_currencies:
+            if quote == symbol.lower() or quote not in fx_rates:
+                continue
+            quote_symbol = self.quote_symbol(symbol, quote)
+            derived = self.derive_quote(df, fx_rates[quote])
+            self.save_to_csv(self.add_features(derived, quote_symbol), quote_symbol)
+            saved += 1
+        return saved
+
+    def process_quotes(self, symbols, quote_currencies=None, days=90):
+        """
+        Busca cada moeda uma única vez em USD e deriva as demais cotações.
+        
+        O número de requisições é len(symbols) + len(quote_currencies) - 1,
+        em vez de len(symbols) * len(quote_currencies).
+        
+        Args:
+            symbols (dict): Mapeamento símbolo -> ID CoinGecko
+            quote_currencies (list): Moedas de cotação (padrão: QUOTE_CURRENCIES)
+            days (int): Número de dias de histórico
+        
+        Returns:
+            int: Número de séries salvas
+        """
+        quote_currencies = quote_currencies or QUOTE_CURRENCIES
+        fx_rates = self.fetch_quote_rates(quote_currencies, days)
+
+        saved = 0
+        for symbol, coin_id in symbols.items():
+            raw_data = self.fetch_data(coin_id, days)
+            df = self.process_data(raw_data, symbol)
+            if df.empty:
+                continue
+            saved += self.save_quotes(df, symbol, fx_rates, quote_currencies)
+
+        return saved
+
     def create_sample_data(self, symbol, days=90):
         """
         Cria dados de exemplo quando a API não está disponível.
@@ -183,6 +500,9 @@ class CoinGeckoProcessor:
         Returns:
             pandas.DataFrame: DataFrame com dados de exemplo
         """
+        import random
+        import pandas as pd
+
         print(f"🎲 Criando dados de exemplo para {symbol}...")
         
         # Preços base realistas por moeda
@@ -201,14 +521,15 @@ class CoinGeckoProcessor:
         
         base_price = base_prices.get(symbol, 100)
         
-        # Gerar dados de exemplo
-        start_date = datetime.now() - timedelta(days=days)
+        # Gerar dados de exemplo (timestamps UTC em milissegundos)
+        day_ms = 24 * 60 * 60 * 1000
+        start_ms = int(time.time() * 1000) - days * day_ms
         data = []
         
         current_price = base_price
         
         for i in range(days):
-            date = start_date + timedelta(days=i)
+            timestamp = start_ms + i * day_ms
             
             # Variação diária realista
             variation = random.uniform(-0.05, 0.05)  # ±5%
@@ -221,7 +542,7 @@ class CoinGeckoProcessor:
             close_price = current_price * (1 + random.uniform(-0.01, 0.01))
             
             data.append({
-                'timestamp': date,
+                'timestamp': timestamp,
                 'open': open_price,
                 'high': high_price,
                 'low': low_price,
@@ -243,6 +564,10 @@ def main():
     print("🚀 QuantConnect CoinGecko Data Processor")
     print("=" * 50)
     print("💡 Versão com fallback para dados de exemplo")
+    if CONFIG_LOADED:
+        print("✅ Configurações carregadas do config.py")
+    else:
+        print("⚠️  Usando configurações padrão (config.py não encontrado)")
     print()
     
     processor = CoinGeckoProcessor()
@@ -251,6 +576,9 @@ def main():
     # Processar apenas algumas moedas para evitar rate limit
     limited_symbols = dict(list(CRYPTO_SYMBOLS.items())[:5])  # Primeiras 5
     
+    # Uma série de câmbio por moeda de cotação, compartilhada por todas as moedas
+    fx_rates = processor.fetch_quote_rates(QUOTE_CURRENCIES)
+    
     for symbol, coin_id in limited_symbols.items():
         print(f"\n📈 Processando {symbol} ({coin_id})...")
         
@@ -261,13 +589,13 @@ def main():
             if raw_data:
                 # Dados reais da API
                 df = processor.process_data(raw_data, symbol)
-                processor.save_to_csv(df, symbol)
+                processor.save_quotes(df, symbol, fx_rates)
                 success_count += 1
             else:
                 # Fallback: criar dados de exemplo
                 print(f"🎲 API indisponível, criando dados de exemplo para {symbol}...")
                 df = processor.create_sample_data(symbol)
-                processor.save_to_csv(df, symbol)
+                processor.save_quotes(df, symbol, fx_rates)
                 success_count += 1
                 
         except Exception as e:
@@ -0,0 +1,138 @@
+"""
+Armazenamento em blocos mensais endereçados por conteúdo
+
+Cada símbolo é dividido em blocos mensais imutáveis, nomeados pelo hash do
+conteúdo, e um manifesto pequeno aponta para os blocos atuais:
+
+    <símbolo>/<símbolo>.json
+    <símbolo>/chunks/<YYYYMM>-<sha256>.csv
+
+Reprocessar dados inalterados não grava nenhum bloco; apenas os meses que
+mudaram geram arquivos novos, e o manifesto só é regravado se mudar.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+MANIFEST_VERSION = 1
+CHUNK_DIR = "chunks"
+HASH_LENGTH = 16
+
+
+def manifest_path(symbol_dir, symbol):
+    """Retorna o caminho do manifesto de um símbolo."""
+    return os.path.join(symbol_dir, f"{symbol.lower()}.json")
+
+
+def read_manifest(path):
+    """
+    Lê um manifesto de blocos.
+
+    Args:
+        path (str): Caminho do manifesto
+
+    Returns:
+        dict: Conteúdo do manifesto ou None se não existir
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def chunk_paths(path):
+    """
+    Lista os blocos de um manifesto em ordem cronológica.
+
+    Args:
+        path (str): Caminho do manifesto
+
+    Returns:
+        list: Caminhos dos blocos (vazia se o manifesto não existir)
+    """
+    manifest = read_manifest(path)
+    if manifest is None:
+        return []
+    symbol_dir = os.path.dirname(path)
+    return [os.path.join(symbol_dir, chunk['file'])
+            for _, chunk in sorted(manifest['chunks'].items())]
+
+
+def _write_atomic(path, content):
+    """Grava o arquivo por substituição, sem deixar versões parciais."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', newline='') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_chunks(out, symbol_dir, symbol):
+    """
+    Grava um DataFrame já formatado em blocos mensais e atualiza o manifesto.
+
+    Args:
+        out (pandas.DataFrame): Linhas no formato final, indexadas por
+            timestamp UTC em milissegundos e ordenadas
+        symbol_dir (str): Diretório do símbolo
+        symbol (str): Símbolo da criptomoeda
+
+    Returns:
+        tuple: (blocos gravados, total de blocos)
+    """
+    os.makedirs(os.path.join(symbol_dir, CHUNK_DIR), exist_ok=True)
+
+    times = np.asarray(out.index, dtype='int64')
+    months = times.astype('datetime64[ms]').astype('datetime64[M]')
+    _, starts = np.unique(months, return_index=True)
+    bounds = list(starts) + [len(out)]
+
+    chunks = {}
+    written = 0
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        month = str(months[start]).replace('-', '')
+        content = out.iloc[start:end].to_csv(header=False, lineterminator='\n')
+        digest = hashlib.sha256(content.encode()).hexdigest()[:HASH_LENGTH]
+        filename = os.path.join(CHUNK_DIR, f"{month}-{digest}.csv")
+
+        chunk_file = os.path.join(symbol_dir, filename)
+        if not os.path.exists(chunk_file):
+            _write_atomic(chunk_file, content)
+            written += 1
+
+        chunks[month] = {
+            'file': filename.replace(os.sep, '/'),
+            'rows': int(end - start),
+            'start': int(times[start]),
+            'end': int(times[end - 1]),
+        }
+
+    manifest = {'version': MANIFEST_VERSION, 'symbol': symbol.upper(), 'chunks': chunks}
+    path = manifest_path(symbol_dir, symbol)
+    if read_manifest(path) != manifest:
+        _write_atomic(path, json.dumps(manifest, indent=1, sort_keys=True) + '\n')
+
+    # Remove blocos que deixaram de ser referenciados
+    referenced = {os.path.basename(chunk['file']) for chunk in chunks.values()}
+    for name in os.listdir(os.path.join(symbol_dir, CHUNK_DIR)):
+        if name not in referenced:
+            os.remove(os.path.join(symbol_dir, CHUNK_DIR, name))
+
+    return written, len(chunks)
+
+
+def remove_chunks(symbol_dir, symbol):
+    """
+    Remove o manifesto e os blocos de um símbolo.
+
+    Usado quando o símbolo volta a ser gravado em arquivo único, para que
+    leitores que preferem o manifesto não continuem lendo dados antigos.
+    """
+    path = manifest_path(symbol_dir, symbol)
+    if os.path.exists(path):
+        os.remove(path)
+    shutil.rmtree(os.path.join(symbol_dir, CHUNK_DIR), ignore_errors=True)
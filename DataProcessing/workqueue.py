@@ -0,0 +1,304 @@
+"""
+Fila de trabalho compartilhada para backfill distribuído
+
+Vários workers (processos ou máquinas com um sistema de arquivos comum)
+dividem as tarefas por meio de um arquivo SQLite. Cada worker reserva uma
+moeda por vez com um lease, renova o lease periodicamente (heartbeat)
+enquanto trabalha e marca a tarefa como concluída ao final. Leases vencidos,
+de workers que pararam, voltam a ficar disponíveis para os demais.
+
+Cada worker usa sua própria chave de API e seu próprio limite de
+requisições, e grava os resultados no layout de saída habitual.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from DataProcessing.jobs import Task, task_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key TEXT PRIMARY KEY,
+    job TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    coin_id TEXT NOT NULL,
+    days INTEGER NOT NULL,
+    resolution TEXT,
+    output_dir TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    quote_currencies TEXT NOT NULL DEFAULT 'usd',
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated REAL
+)
+"""
+
+
+class WorkQueue:
+    """Fila de tarefas com leases sobre um arquivo SQLite compartilhado."""
+
+    def __init__(self, path, lease_seconds=300, max_attempts=3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.conn = self._connect()
+        self.conn.execute(SCHEMA)
+
+    def _connect(self):
+        # Autocommit; as transações de reserva são abertas explicitamente
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def close(self):
+        self.conn.close()
+
+    def enqueue(self, tasks):
+        """
+        Adiciona tarefas à fila.
+
+        Tarefas já concluídas ou que falharam voltam a ficar pendentes;
+        tarefas pendentes ou em andamento não são alteradas.
+
+        Args:
+            tasks (list): Tarefas (jobs.Task)
+
+        Returns:
+            int: Número de tarefas adicionadas ou reabertas
+        """
+        before = self.conn.total_changes
+        self.conn.execute("BEGIN IMMEDIATE")
+        self.conn.executemany(
+            """
+            INSERT INTO tasks (key, job, symbol, coin_id, days, resolution, output_dir, priority,
+                               quote_currencies, updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                status = 'pending', owner = NULL, lease_expires = NULL, attempts = 0,
+                job = excluded.job, days = excluded.days, priority = excluded.priority,
+                quote_currencies = excluded.quote_currencies, updated = excluded.updated
+            WHERE status IN ('done', 'failed')
+            """,
+            [(task_key(task), task.job, task.symbol, task.coin_id, task.days, task.resolution,
+              task.output_dir, task.priority, ','.join(task.quote_currencies), time.time())
+             for task in tasks]
+        )
+        self.conn.execute("COMMIT")
+        return self.conn.total_changes - before
+
+    def claim(self, worker_id, now=None):
+        """
+        Reserva a tarefa pendente (ou com lease vencido) mais prioritária.
+
+        Um lease vencido de tarefa que já atingiu max_attempts marca a tarefa
+        como falha, em vez de reservá-la de novo.
+
+        Args:
+            worker_id (str): Identificador do worker
+            now (float): Horário atual em epoch (padrão: time.time())
+
+        Returns:
+            tuple: (chave, jobs.Task) ou None se não houver tarefas
+        """
+        now = time.time() if now is None else now
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Leases vencidos que já esgotaram as tentativas não voltam à fila
+            self.conn.execute(
+                """
+                UPDATE tasks SET status = 'failed', owner = NULL, lease_expires = NULL, updated = ?
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+                """,
+                (now, now, self.max_attempts)
+            )
+            row = self.conn.execute(
+                """
+                SELECT key, job, symbol, coin_id, days, resolution, output_dir, priority, quote_currencies
+                FROM tasks
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY priority DESC, attempts, key
+                LIMIT 1
+                """,
+                (now,)
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+
+            self.conn.execute(
+                """
+                UPDATE tasks
+                SET status = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1, updated = ?
+                WHERE key = ?
+                """,
+                (worker_id, now + self.lease_seconds, now, row[0])
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        key, job, symbol, coin_id, days, resolution, output_dir, priority, quotes = row
+        return key, Task(job, symbol, coin_id, days, resolution, output_dir, priority, 0.0,
+                         tuple(quotes.split(',')))
+
+    def heartbeat(self, key, worker_id, now=None):
+        """
+        Renova o lease de uma tarefa reservada.
+
+        Returns:
+            bool: False se o lease foi perdido para outro worker
+        """
+        now = time.time() if now is None else now
+        cursor = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ?, updated = ? WHERE key = ? AND owner = ? AND status = 'leased'",
+            (now + self.lease_seconds, now, key, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, key, worker_id):
+        """Marca a tarefa como concluída, se o lease ainda for deste worker."""
+        cursor = self.conn.execute(
+            "UPDATE tasks SET status = 'done', lease_expires = NULL, updated = ? "
+            "WHERE key = ? AND owner = ? AND status = 'leased'",
+            (time.time(), key, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, key, worker_id):
+        """Devolve a tarefa à fila, ou a marca como falha após max_attempts."""
+        cursor = self.conn.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "owner = NULL, lease_expires = NULL, updated = ? "
+            "WHERE key = ? AND owner = ? AND status = 'leased'",
+            (self.max_attempts, time.time(), key, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def refreshed(self):
+        """
+        Retorna o horário de conclusão das tarefas concluídas.
+
+        Returns:
+            dict: Chave da tarefa -> epoch (segundos), no formato do arquivo
+                de estado de jobs.read_state
+        """
+        return dict(self.conn.execute("SELECT key, updated FROM tasks WHERE status = 'done'"))
+
+    def counts(self):
+        """Retorna o número de tarefas por status."""
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status"))
+
+
+def enqueue_spec(spec_path, queue_path):
+    """
+    Enfileira as tarefas vencidas de uma especificação de jobs.
+
+    A última atualização de cada tarefa vem do arquivo de estado e do horário
+    de conclusão registrado na própria fila, o que for mais recente.
+
+    Args:
+        spec_path (str): Caminho da especificação (ver jobs.load_spec)
+        queue_path (str): Caminho do arquivo SQLite da fila
+
+    Returns:
+        int: Número de tarefas adicionadas ou reabertas
+    """
+    from DataProcessing.jobs import build_tasks, load_spec, read_state
+    from DataProcessing.process import CoinGeckoProcessor
+
+    spec = load_spec(spec_path)
+    processor = CoinGeckoProcessor()
+    processor.request_delay = 60 / spec['rate_limit_per_minute']
+
+    queue = WorkQueue(queue_path)
+    try:
+        # Workers não gravam o arquivo de estado: a conclusão fica na fila
+        state = read_state(spec['state_file'])
+        for key, updated in queue.refreshed().items():
+            state[key] = max(state.get(key, 0), updated)
+        added = queue.enqueue(build_tasks(spec, processor, state, time.time()))
+    finally:
+        queue.close()
+    print(f"📥 {added} tarefas enfileiradas em {queue_path}")
+    return added
+
+
+def _keep_alive(queue_path, key, worker_id, lease_seconds, stop):
+    """Renova o lease em segundo plano até stop ser sinalizado."""
+    queue = WorkQueue(queue_path, lease_seconds)
+    try:
+        while not stop.wait(lease_seconds / 3):
+            if not queue.heartbeat(key, worker_id):
+                break
+    finally:
+        queue.close()
+
+
+def run_worker(queue_path, worker_id=None, api_key=None, rate_limit_per_minute=30,
+               lease_seconds=300, processor=None):
+    """
+    Processa tarefas da fila até esvaziá-la.
+
+    Args:
+        queue_path (str): Caminho do arquivo SQLite da fila
+        worker_id (str): Identificador do worker (padrão: host:pid)
+        api_key (str): Chave de API CoinGecko deste worker
+        rate_limit_per_minute (float): Limite de requisições deste worker
+        lease_seconds (float): Duração do lease de cada tarefa
+        processor (CoinGeckoProcessor): Processador a usar (padrão: novo)
+
+    Returns:
+        int: Número de tarefas concluídas por este worker
+    """
+    from DataProcessing.process import CoinGeckoProcessor
+
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    processor = processor or CoinGeckoProcessor()
+    processor.request_delay = 60 / rate_limit_per_minute
+    if api_key:
+        processor.headers['x-cg-demo-api-key'] = api_key
+    default_output_dir = processor.output_dir
+
+    queue = WorkQueue(queue_path, lease_seconds)
+    fx_cache = {}
+    done = 0
+    try:
+        while True:
+            claimed = queue.claim(worker_id)
+            if claimed is None:
+                break
+            key, task = claimed
+
+            stop = threading.Event()
+            keeper = threading.Thread(target=_keep_alive,
+                                      args=(queue_path, key, worker_id, lease_seconds, stop),
+                                      daemon=True)
+            keeper.start()
+            try:
+                processor.output_dir = task.output_dir or default_output_dir
+                raw_data = processor.fetch_data(task.coin_id, task.days, interval=task.resolution)
+                df = processor.process_data(raw_data, task.symbol)
+                if df.empty:
+                    queue.fail(key, worker_id)
+                    continue
+                fx_rates = processor.fetch_quote_rates(task.quote_currencies, task.days, fx_cache,
+                                                       interval=task.resolution)
+                processor.save_quotes(df, task.symbol, fx_rates, task.quote_currencies)
+                if queue.complete(key, worker_id):
+                    done += 1
+            except Exception as e:
+                print(f"❌ [{worker_id}] Erro ao processar {task.symbol}: {e}")
+                queue.fail(key, worker_id)
+            finally:
+                stop.set()
+                keeper.join()
+    finally:
+        processor.output_dir = default_output_dir
+        queue.close()
+
+    print(f"🏁 [{worker_id}] {done} tarefas concluídas")
+    return done
@@ -1,16 +1,63 @@
+from QuantConnect import TimeZones
 from QuantConnect.Data import SubscriptionDataSource, BaseData
 from QuantConnect.Python import PythonData
-from datetime import datetime, timedelta
+from datetime import timedelta
+import json
 import os
 
+# Os timestamps dos arquivos são UTC; LEAN trabalha com datas sem fuso
+# expressas no DataTimeZone declarado abaixo
+from .bars import EPOCH, CoinGeckoBar, parse_timestamp
+
+# Manifestos de blocos mensais já lidos: caminho -> (mtime, blocos)
+_manifests = {}
+
+def _manifest_chunks(path):
+    """Retorna os blocos {YYYYMM: entrada} de um manifesto, ou None se não existir."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _manifests.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path) as f:
+            cached = (mtime, json.load(f)["chunks"])
+        _manifests[path] = cached
+    return cached[1]
+
 class CoinGeckoData(PythonData):
     """Classe de dados customizada para CoinGecko, herda de PythonData."""
 
     def GetSource(self, config, date, isLiveMode):
         """Define a fonte de dados (arquivo CSV) para uma data específica."""
-        source = os.path.join("data", "crypto", config.Symbol.Value.lower(), f"{config.Symbol.Value.lower()}.csv")
+        symbol = config.Symbol.Value.lower()
+        symbol_dir = os.path.join("data", "crypto", symbol)
+        source = os.path.join(symbol_dir, f"{symbol}.csv")
+
+        # Armazenamento em blocos: usa o bloco do mês da data solicitada
+        chunks = _manifest_chunks(os.path.join(symbol_dir, f"{symbol}.json"))
+        if chunks:
+            chunk = chunks.get(date.strftime("%Y%m"))
+            if chunk is not None:
+                source = os.path.join(symbol_dir, *chunk["file"].split("/"))
+
         return SubscriptionDataSource(source, 0) # 0 for local file
 
+    @property
+    def Features(self):
+        """Indicadores pré-calculados da barra, por nome (ex: 'sma_20')."""
+        return {name: self[name] for name in getattr(self, "_feature_names", ())}
+
+    def ToBar(self):
+        """Converte para CoinGeckoBar, para guardar históricos longos em memória."""
+        timestamp = int((self.Time - EPOCH).total_seconds() * 1000)
+        return CoinGeckoBar(timestamp, self["Open"], self["High"], self["Low"], self["Close"], self["Volume"],
+                            self.EndTime - self.Time)
+
+    def DataTimeZone(self):
+        """Os dados são gravados em UTC, alinhados ao relógio cripto do LEAN."""
+        return TimeZones.Utc
+
     def Reader(self, config, line, date, isLiveMode):
         """Lê uma linha do arquivo de dados e a transforma em um objeto CoinGeckoData."""
         if not (line.strip() and line[0].isdigit()):
@@ -21,10 +68,12 @@ class CoinGeckoData(PythonData):
         data.Symbol = config.Symbol
 
         try:
-            # Formato do CSV: YYYYMMDD HH:MM,open,high,low,close,volume
+            # Formato do CSV: timestamp UTC em ms,open,high,low,close,volume[,nome=valor...]
+            # (arquivos antigos usam YYYYMMDD HH:MM, também em UTC)
             parts = line.split(',')
-            data.Time = datetime.strptime(parts[0], "%Y%m%d %H:%M")
-            data.EndTime = data.Time + timedelta(days=1)
+            data.Time = EPOCH + timedelta(milliseconds=parse_timestamp(parts[0]))
+            # Duração da barra conforme a resolução da assinatura (ex: Hour, Daily)
+            data.EndTime = data.Time + timedelta(seconds=config.Increment.TotalSeconds)
             data.Value = float(parts[4])  # Preço de fechamento como valor principal
 
             data["Open"] = float(parts[1])
@@ -33,9 +82,16 @@ class CoinGeckoData(PythonData):
             data["Close"] = float(parts[4])
             data["Volume"] = float(parts[5])
 
+            # Indicadores pré-calculados: colunas extras no formato nome=valor
+            names = []
+            for part in parts[6:]:
+                name, value = part.split('=', 1)
+                data[name] = float(value)
+                names.append(name)
+            data._feature_names = tuple(names)
+
         except Exception as e:
             print(f"Erro ao processar linha: {line} - {e}")
             return None
 
         return data
-
@@ -2,9 +2,24 @@
 Módulo de Leitura de Dados
 
 Este módulo contém a classe CoinGeckoData que estende PythonData
-para permitir que o QuantConnect LEAN leia os dados processados.
+para permitir que o QuantConnect LEAN leia os dados processados, e o
+carregador de painel multi-símbolo e as barras compactas usados em pesquisa.
+
+CoinGeckoData (que depende do QuantConnect) e o carregador de painel
+(pandas/NumPy) só são importados no primeiro acesso, de modo que o pacote
+pode ser usado em pesquisa sem o LEAN e continua leve na inicialização.
 """
 
-from .CoinGeckoDataReader import CoinGeckoData
+from .bars import BarStore, CoinGeckoBar, load_bars
+
+__all__ = ['CoinGeckoData', 'CoinGeckoBar', 'BarStore', 'load_bars', 'load_panel']
+
 
-__all__ = ['CoinGeckoData']
+def __getattr__(name):
+    if name == 'CoinGeckoData':
+        from .CoinGeckoDataReader import CoinGeckoData
+        return CoinGeckoData
+    if name == 'load_panel':
+        from .panel import load_panel
+        return load_panel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
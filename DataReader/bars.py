@@ -0,0 +1,204 @@
+"""
+Representação compacta de barras para históricos em memória
+
+O LEAN exige um objeto PythonData por linha lida pelo CoinGeckoData.Reader,
+com um dicionário de propriedades por instância. Para históricos longos
+mantidos em memória (janelas rolantes, pesquisa) este módulo oferece:
+
+    CoinGeckoBar  Uma barra com __slots__ (sem __dict__ por instância)
+    BarStore      Colunas NumPy compartilhadas (struct-of-arrays); o acesso
+                  por índice devolve um BarView, sem copiar os dados
+
+A duração da barra (EndTime - Time) depende da granularidade da série
+(30 min, horas, dias). O BarStore a infere do espaçamento dos timestamps;
+CoinGeckoBar a recebe explicitamente (padrão: um dia), e CoinGeckoData.ToBar
+usa a resolução da assinatura do LEAN.
+
+Memória por barra (CPython 64 bits, medida com tracemalloc em
+tests/test_bars.py sobre 20.000 barras):
+
+    CoinGeckoData (mock de PythonData com _props)  ~ 540 bytes
+    CoinGeckoBar (__slots__ + int/float)           ~ 250 bytes
+    BarStore (int64 + 5 x float64)                    48 bytes
+"""
+
+from datetime import datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1)
+DEFAULT_PERIOD = timedelta(days=1)
+
+
+def parse_timestamp(field):
+    """
+    Converte o campo de tempo do CSV para milissegundos UTC.
+
+    Aceita o formato atual (epoch em ms) e o antigo (YYYYMMDD HH:MM, UTC).
+    """
+    if ' ' in field:
+        return int((datetime.strptime(field, "%Y%m%d %H:%M") - EPOCH).total_seconds()) * 1000
+    return int(field)
+
+
+def infer_period(timestamps):
+    """
+    Infere a duração das barras pelo espaçamento mediano dos timestamps.
+
+    Args:
+        timestamps (numpy.ndarray): Timestamps em ms UTC, em ordem cronológica
+
+    Returns:
+        timedelta: Duração de uma barra (DEFAULT_PERIOD se houver menos de
+            duas barras distintas)
+    """
+    import numpy as np
+
+    steps = np.diff(timestamps)
+    steps = steps[steps > 0]
+    if not len(steps):
+        return DEFAULT_PERIOD
+    return timedelta(milliseconds=int(np.median(steps)))
+
+
+class CoinGeckoBar:
+    """Barra OHLCV com __slots__; o tempo é mantido em ms UTC."""
+
+    FIELDS = ('Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume')
+    __slots__ = FIELDS + ('Period',)
+
+    def __init__(self, timestamp, open_price, high, low, close, volume=0.0, period=DEFAULT_PERIOD):
+        self.Timestamp = timestamp
+        self.Open = open_price
+        self.High = high
+        self.Low = low
+        self.Close = close
+        self.Volume = volume
+        self.Period = period
+
+    @classmethod
+    def from_line(cls, line, period=DEFAULT_PERIOD):
+        """Cria uma barra a partir de uma linha do CSV, ou None se inválida."""
+        if not (line.strip() and line[0].isdigit()):
+            return None
+        parts = line.split(',')
+        try:
+            return cls(parse_timestamp(parts[0]), float(parts[1]), float(parts[2]),
+                       float(parts[3]), float(parts[4]), float(parts[5]), period)
+        except (IndexError, ValueError):
+            return None
+
+    @property
+    def Time(self):
+        return EPOCH + timedelta(milliseconds=self.Timestamp)
+
+    @property
+    def EndTime(self):
+        return self.Time + self.Period
+
+    @property
+    def Value(self):
+        return self.Close
+
+    def __repr__(self):
+        return (f"CoinGeckoBar({self.Time:%Y-%m-%d %H:%M}, O={self.Open}, H={self.High}, "
+                f"L={self.Low}, C={self.Close}, V={self.Volume})")
+
+
+class BarView:
+    """Visão de uma barra dentro de um BarStore, sem cópia dos valores."""
+
+    __slots__ = ('_store', '_i')
+
+    def __init__(self, store, i):
+        self._store = store
+        self._i = i
+
+    Timestamp = property(lambda self: int(self._store.timestamps[self._i]))
+    Open = property(lambda self: float(self._store.open[self._i]))
+    High = property(lambda self: float(self._store.high[self._i]))
+    Low = property(lambda self: float(self._store.low[self._i]))
+    Close = property(lambda self: float(self._store.close[self._i]))
+    Volume = property(lambda self: float(self._store.volume[self._i]))
+    Period = property(lambda self: self._store.period)
+    Time = CoinGeckoBar.Time
+    EndTime = CoinGeckoBar.EndTime
+    Value = CoinGeckoBar.Value
+    __repr__ = CoinGeckoBar.__repr__
+
+
+class BarStore:
+    """Histórico de barras em colunas NumPy (struct-of-arrays)."""
+
+    COLUMNS = ('timestamps', 'open', 'high', 'low', 'close', 'volume')
+    __slots__ = COLUMNS + ('period',)
+
+    def __init__(self, timestamps, open_prices, high, low, close, volume, period=None):
+        import numpy as np
+
+        self.timestamps = np.asarray(timestamps, dtype='int64')
+        self.open = np.asarray(open_prices, dtype='float64')
+        self.high = np.asarray(high, dtype='float64')
+        self.low = np.asarray(low, dtype='float64')
+        self.close = np.asarray(close, dtype='float64')
+        self.volume = np.asarray(volume, dtype='float64')
+        self.period = infer_period(self.timestamps) if period is None else period
+
+    @classmethod
+    def from_file(cls, path, start=None, end=None):
+        """
+        Carrega um arquivo de símbolo (CSV ou manifesto de blocos).
+
+        Args:
+            path (str): Caminho do arquivo
+            start: Início do intervalo (inclusivo), data ou ms UTC
+            end: Fim do intervalo (inclusivo), data ou ms UTC
+
+        Returns:
+            BarStore: Barras do intervalo em ordem cronológica
+        """
+        from .panel import FIELDS, read_symbol_file
+
+        times, values = read_symbol_file(path, FIELDS, start, end)
+        order = times.argsort(kind='stable')
+        times, values = times[order], values[order]
+        return cls(times, *values.T)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return BarStore(*(getattr(self, name)[i] for name in self.COLUMNS), period=self.period)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice de barra fora do intervalo")
+        return BarView(self, i)
+
+    def __iter__(self):
+        return (BarView(self, i) for i in range(len(self)))
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos valores das barras, em bytes."""
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS)
+
+
+def load_bars(symbol, start=None, end=None, roots=None):
+    """
+    Carrega o histórico de um símbolo como BarStore.
+
+    Args:
+        symbol (str): Símbolo (ex: 'BTC')
+        start: Início do intervalo (inclusivo), data ou ms UTC
+        end: Fim do intervalo (inclusivo), data ou ms UTC
+        roots (list): Diretórios de dados (padrão: data/crypto e output)
+
+    Returns:
+        BarStore: Barras do intervalo em ordem cronológica
+    """
+    from .panel import find_symbol_files
+
+    files = find_symbol_files(roots)
+    if symbol.upper() not in files:
+        raise FileNotFoundError(f"Arquivo não encontrado para: {symbol}")
+    return BarStore.from_file(files[symbol.upper()], start, end)
@@ -0,0 +1,184 @@
+"""
+Carregador de painel multi-símbolo para pesquisa
+
+Lê vários arquivos de dados em paralelo, alinha as séries em um índice de
+tempo comum e devolve um painel (tempo x símbolo x campo) compacto.
+
+Apenas as colunas pedidas são lidas do CSV. O intervalo de datas só evita
+leitura no armazenamento em blocos mensais, em que os blocos fora do
+intervalo são ignorados; um arquivo único é lido por inteiro e filtrado
+antes de montar o painel.
+"""
+
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ROOTS = (
+    os.path.join(PROJECT_DIR, "data", "crypto"),
+    os.path.join(PROJECT_DIR, "output"),
+)
+
+Panel = namedtuple('Panel', ['values', 'index', 'symbols', 'fields'])
+Panel.__doc__ = """Painel em array: values tem formato (tempo, símbolo, campo)."""
+
+
+def _to_epoch_ms(value):
+    """Converte data/timestamp (UTC) para milissegundos desde a época."""
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return int(np.datetime64(ts.to_datetime64(), 'ms').astype('int64'))
+
+
+def find_symbol_files(roots=None):
+    """
+    Localiza os arquivos <raiz>/<símbolo>/<símbolo>.csv, ou o manifesto
+    <símbolo>.json quando o símbolo é gravado em blocos mensais.
+
+    Args:
+        roots (list): Diretórios de dados (padrão: data/crypto e output)
+
+    Returns:
+        dict: Mapeamento símbolo -> caminho; a primeira raiz tem prioridade
+    """
+    files = {}
+    for root in roots or DEFAULT_ROOTS:
+        if not os.path.isdir(root):
+            continue
+        for name in sorted(os.listdir(root)):
+            if name.upper() in files:
+                continue
+            for ext in ('json', 'csv'):
+                path = os.path.join(root, name, f"{name}.{ext}")
+                if os.path.isfile(path):
+                    files[name.upper()] = path
+                    break
+    return files
+
+
+def _data_files(path, start_ms=None, end_ms=None):
+    """Resolve o manifesto nos blocos que intersectam o intervalo pedido."""
+    if not path.endswith('.json'):
+        return [path]
+    with open(path) as f:
+        chunks = json.load(f)['chunks']
+    symbol_dir = os.path.dirname(path)
+    return [os.path.join(symbol_dir, chunk['file'])
+            for _, chunk in sorted(chunks.items())
+            if (start_ms is None or chunk['end'] >= start_ms)
+            and (end_ms is None or chunk['start'] <= end_ms)]
+
+
+def read_symbol_file(path, fields=FIELDS, start=None, end=None, dtype='float64'):
+    """
+    Lê um arquivo de símbolo com seleção de colunas e intervalo de datas.
+
+    Aceita o formato atual (timestamp UTC em ms), o antigo (YYYYMMDD HH:MM)
+    e manifestos de blocos mensais, lendo só os blocos do intervalo. Um
+    arquivo único é lido por inteiro e as linhas fora do intervalo são
+    descartadas depois da leitura.
+
+    Args:
+        path (str): Caminho do arquivo CSV ou do manifesto
+        fields (tuple): Campos a carregar (subconjunto de FIELDS)
+        start: Início do intervalo (inclusivo), data ou ms UTC
+        end: Fim do intervalo (inclusivo), data ou ms UTC
+        dtype (str): Tipo de ponto flutuante dos valores
+
+    Returns:
+        tuple: (timestamps int64 em ms, array de valores com formato (n, campos))
+    """
+    start_ms, end_ms = _to_epoch_ms(start), _to_epoch_ms(end)
+    usecols = [0] + [FIELDS.index(field) + 1 for field in fields]
+    paths = _data_files(path, start_ms, end_ms)
+    if not paths:
+        return np.array([], dtype='int64'), np.empty((0, len(fields)), dtype=dtype)
+    df = pd.concat([pd.read_csv(p, header=None, usecols=usecols, dtype={0: str}) for p in paths],
+                   ignore_index=True)
+    df = df[usecols]
+
+    raw_times = df[0]
+    if raw_times.str.contains(' ', regex=False).any():
+        times = pd.to_datetime(raw_times, format='%Y%m%d %H:%M')
+        times = times.values.astype('datetime64[ms]').astype('int64')
+    else:
+        times = raw_times.astype('int64').to_numpy()
+
+    mask = np.ones(len(times), dtype=bool)
+    if start_ms is not None:
+        mask &= times >= start_ms
+    if end_ms is not None:
+        mask &= times <= end_ms
+
+    values = df.iloc[:, 1:].to_numpy(dtype=dtype)[mask]
+    return times[mask], values
+
+
+def load_panel(symbols=None, fields=('close',), start=None, end=None, roots=None,
+               dtype='float64', as_array=False, max_workers=None):
+    """
+    Carrega um painel (tempo x símbolo x campo) para vários símbolos.
+
+    Os arquivos são lidos em paralelo e alinhados na união dos timestamps;
+    barras ausentes em um símbolo ficam como NaN.
+
+    Args:
+        symbols (list): Símbolos a carregar (padrão: todos os encontrados)
+        fields (tuple): Campos a carregar (ex: ('open', 'close'))
+        start: Início do intervalo (inclusivo), data ou ms UTC
+        end: Fim do intervalo (inclusivo), data ou ms UTC
+        roots (list): Diretórios de dados (padrão: data/crypto e output)
+        dtype (str): 'float32' ou 'float64'
+        as_array (bool): Retorna Panel (NumPy) em vez de DataFrame
+        max_workers (int): Número de threads de leitura
+
+    Returns:
+        pandas.DataFrame | Panel: DataFrame com índice de data (UTC) e
+        colunas MultiIndex (símbolo, campo), ou Panel com o array 3D
+    """
+    fields = tuple(field.lower() for field in fields)
+    unknown = set(fields) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Campos desconhecidos: {sorted(unknown)}")
+
+    files = find_symbol_files(roots)
+    if symbols is None:
+        symbols = list(files)
+    symbols = [symbol.upper() for symbol in symbols]
+    missing = [symbol for symbol in symbols if symbol not in files]
+    if missing:
+        raise FileNotFoundError(f"Arquivos não encontrados para: {missing}")
+
+    def read(symbol):
+        return read_symbol_file(files[symbol], fields, start, end, dtype)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        series = list(executor.map(read, symbols))
+
+    if series:
+        index = np.unique(np.concatenate([times for times, _ in series]))
+    else:
+        index = np.array([], dtype='int64')
+    values = np.full((len(index), len(symbols), len(fields)), np.nan, dtype=dtype)
+    for i, (times, data) in enumerate(series):
+        rows = np.searchsorted(index, times)
+        values[rows, i, :] = data
+
+    if as_array:
+        return Panel(values, index, symbols, fields)
+
+    columns = pd.MultiIndex.from_product([symbols, fields], names=['symbol', 'field'])
+    frame_index = pd.DatetimeIndex(index.astype('datetime64[ms]'), name='time')
+    return pd.DataFrame(values.reshape(len(index), len(symbols) * len(fields)), index=frame_index, columns=columns)
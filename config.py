@@ -26,6 +26,16 @@ CRYPTO_SYMBOLS = {
 
 # Configurações de processamento
 DEFAULT_VS_CURRENCY = "usd"
+# Moedas de cotação geradas; as diferentes de USD são derivadas da série
+# em USD com uma única série de câmbio por moeda
+QUOTE_CURRENCIES = ["usd"]
+FX_REFERENCE_COIN = "tether"  # Moeda atrelada ao USD usada como taxa de câmbio
+# Indicadores pré-calculados gravados junto aos preços (vazio = desativado)
+# Ex: ['return_1', 'sma_20', 'ema_20', 'volatility_20']
+FEATURES = []
+# Grava cada símbolo em blocos mensais imutáveis (nomeados pelo hash do
+# conteúdo) com um manifesto <símbolo>.json, em vez de um CSV único
+CHUNKED_STORAGE = False
 DEFAULT_DAYS = "max"  # Obter dados históricos completos
 REQUEST_DELAY = 1.0   # Delay entre requests para evitar rate limiting
 
@@ -4,6 +4,7 @@ Script launcher para executar o processador de dados CoinGecko
 Execute este arquivo da raiz do projeto para evitar problemas de importação
 """
 
+import argparse
 import sys
 import os
 
@@ -14,10 +15,36 @@ sys.path.insert(0, current_dir)
 def main():
     """Executa o processador de dados."""
     
+    parser = argparse.ArgumentParser(description="CoinGecko Data Processor")
+    parser.add_argument("--jobs", help="Arquivo de jobs (JSON/YAML); ex: DataProcessing/jobs.sample.json")
+    parser.add_argument("--dry-run", action="store_true", help="Apenas lista as tarefas agendadas")
+    parser.add_argument("--queue", help="Fila SQLite compartilhada para backfill distribuído")
+    parser.add_argument("--enqueue", action="store_true", help="Enfileira as tarefas de --jobs em --queue")
+    parser.add_argument("--worker-id", help="Identificador do worker (padrão: host:pid)")
+    parser.add_argument("--api-key", default=os.environ.get("COINGECKO_API_KEY"),
+                        help="Chave de API deste worker (padrão: $COINGECKO_API_KEY)")
+    parser.add_argument("--rate-limit", type=float, default=30, help="Requisições por minuto deste worker")
+    args = parser.parse_args()
+    
     print("🚀 Launcher do CoinGecko Data Processor")
     print("=" * 50)
     
     try:
+        if args.queue:
+            # Backfill distribuído: enfileirar tarefas ou executar um worker
+            from DataProcessing.workqueue import enqueue_spec, run_worker
+            if args.enqueue:
+                enqueue_spec(args.jobs, args.queue)
+            else:
+                run_worker(args.queue, args.worker_id, args.api_key, args.rate_limit)
+            return
+
+        if args.jobs:
+            # Executar a partir da especificação de jobs
+            from DataProcessing.jobs import run_jobs
+            run_jobs(args.jobs, dry_run=args.dry_run)
+            return
+
         # Importar e executar o processador
         from DataProcessing.process import main as process_main
         process_main()
@@ -45,5 +45,6 @@ def mock_config():
     """Fixture for a mock SubscriptionDataConfig."""
     config = MagicMock()
     config.Symbol.Value = "BTC"
+    config.Increment.TotalSeconds = 86400.0  # Resolution.Daily
     return config
 
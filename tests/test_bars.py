@@ -0,0 +1,93 @@
+
+import tracemalloc
+import pytest
+from datetime import datetime, timedelta
+from DataReader.bars import BarStore, CoinGeckoBar, load_bars
+from DataReader.CoinGeckoDataReader import CoinGeckoData
+
+N_BARS = 20_000
+LINES = [f"{1672531200000 + i * 3600000},{16500.0 + i * 0.37},{16800.1 + i},{16400.3 + i},{16750.7 + i},{i * 1.5}"
+         for i in range(N_BARS)]
+
+def bytes_per_bar(build):
+    """Memória retida por barra (tracemalloc) pelo objeto criado em build()."""
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert kept is not None
+    return current / N_BARS
+
+def test_bar_from_line():
+    bar = CoinGeckoBar.from_line("1672531200000,16500.0,16800.0,16400.0,16750.0,0")
+    assert bar.Time == datetime(2023, 1, 1)
+    assert bar.Value == bar.Close == 16750.0
+    assert not hasattr(bar, '__dict__')
+    assert CoinGeckoBar.from_line("20230101 00:00,1,2,0.5,1.5,0").Timestamp == 1672531200000
+    assert CoinGeckoBar.from_line("20230101 00:00,1,2") is None
+
+def test_reader_to_bar(mock_config):
+    data = CoinGeckoData().Reader(mock_config, LINES[1], datetime.now(), isLiveMode=False)
+    bar = data.ToBar()
+    assert bar.Time == data.Time
+    assert bar.Close == data["Close"]
+    assert bar.EndTime == data.EndTime
+
+def test_reader_hourly_period_matches_bar_store(mock_config, tmp_path):
+    mock_config.Increment.TotalSeconds = 3600.0  # Resolution.Hour
+    data = CoinGeckoData().Reader(mock_config, LINES[1], datetime.now(), isLiveMode=False)
+    assert data.EndTime == data.Time + timedelta(hours=1)
+
+    (tmp_path / "btc").mkdir()
+    (tmp_path / "btc" / "btc.csv").write_text("\n".join(LINES[:5]) + "\n")
+    store = load_bars('btc', roots=[str(tmp_path)])
+    assert data.ToBar().EndTime == store[1].EndTime
+
+def test_bar_store_views_and_slices():
+    bars = [CoinGeckoBar.from_line(line) for line in LINES[:10]]
+    store = BarStore(*([getattr(bar, name) for bar in bars]
+                       for name in CoinGeckoBar.FIELDS))
+    assert len(store) == 10
+    assert store[-1].Close == bars[-1].Close
+    assert store[3].Time == bars[3].Time
+    assert len(store[2:5]) == 3
+    assert store.nbytes == 10 * 48
+    with pytest.raises(IndexError):
+        store[10]
+
+def test_bar_period_follows_series_spacing():
+    # LINES são barras horárias; uma lacuna não altera o período inferido
+    bars = [CoinGeckoBar.from_line(line) for line in LINES[:3] + LINES[5:8]]
+    store = BarStore(*([getattr(bar, name) for bar in bars]
+                       for name in CoinGeckoBar.FIELDS))
+    assert store.period == timedelta(hours=1)
+    assert store[0].EndTime == store[0].Time + timedelta(hours=1)
+    assert store[1:3].period == timedelta(hours=1)
+    assert BarStore([0], [1], [1], [1], [1], [0]).period == timedelta(days=1)
+
+    bar = CoinGeckoBar.from_line(LINES[0], period=timedelta(minutes=30))
+    assert bar.EndTime == datetime(2023, 1, 1, 0, 30)
+
+def test_load_bars(tmp_path):
+    (tmp_path / "btc").mkdir()
+    (tmp_path / "btc" / "btc.csv").write_text("\n".join(LINES[:5]) + "\n")
+    store = load_bars('btc', start=int(LINES[1].split(',')[0]), roots=[str(tmp_path)])
+    assert len(store) == 4
+    assert store[0].Open == pytest.approx(16500.37)
+
+def test_memory_per_bar(mock_config):
+    """Benchmark de memória; os valores medidos estão documentados em DataReader/bars.py."""
+    reader = CoinGeckoData()
+    python_data = bytes_per_bar(lambda: [reader.Reader(mock_config, line, None, False) for line in LINES])
+    slotted = bytes_per_bar(lambda: [CoinGeckoBar.from_line(line) for line in LINES])
+    bars = [CoinGeckoBar.from_line(line) for line in LINES]
+    columns = [[getattr(bar, name) for bar in bars] for name in CoinGeckoBar.FIELDS]
+    # Importa numpy (carregado sob demanda) fora da janela medida
+    BarStore(*(column[:1] for column in columns))
+    store = bytes_per_bar(lambda: BarStore(*columns))
+
+    assert store < 50
+    assert slotted < 300
+    assert slotted < python_data / 2
@@ -0,0 +1,71 @@
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from DataProcessing.features import _compute, compute_features, parse_feature, update_features
+from DataProcessing.process import CoinGeckoProcessor
+
+FEATURES = ['return_1', 'logreturn_2', 'sma_3', 'ema_3', 'volatility_3']
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(7)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 40)))
+    index = 1672531200000 + np.arange(40, dtype='int64') * 86400000
+    return pd.Series(values, index=index, name='close')
+
+def test_parse_feature():
+    assert parse_feature('sma_20') == ('sma', 20)
+    with pytest.raises(ValueError):
+        parse_feature('median_5')
+
+def test_compute_features(close):
+    features = compute_features(close, FEATURES)
+    assert list(features.columns) == FEATURES
+    assert features['sma_3'].iloc[2] == pytest.approx(close.iloc[:3].mean())
+    assert features['return_1'].iloc[1] == pytest.approx(close.iloc[1] / close.iloc[0] - 1)
+    assert np.isnan(features['volatility_3'].iloc[2])
+
+def test_update_features_matches_full_recompute(close):
+    previous = compute_features(close.iloc[:30], FEATURES)
+    previous.insert(0, 'close', close.iloc[:30])
+
+    updated = update_features(close, FEATURES, previous)
+    expected = compute_features(close, FEATURES)
+    pd.testing.assert_frame_equal(updated, expected)
+
+def test_update_features_sliding_window(close):
+    previous = compute_features(close.iloc[:39], FEATURES)
+    previous.insert(0, 'close', close.iloc[:39])
+
+    # Janela deslizante: sai a primeira barra e entra uma nova
+    with patch('DataProcessing.features._compute', wraps=_compute) as mock_compute:
+        updated = update_features(close.iloc[1:], FEATURES, previous)
+
+    expected = compute_features(close, FEATURES).iloc[1:]
+    pd.testing.assert_frame_equal(updated, expected)
+    # Apenas a barra nova é recalculada, com o aquecimento mínimo
+    assert max(len(call.args[2]) for call in mock_compute.call_args_list) <= 5
+
+def test_update_features_recomputes_changed_bar(close):
+    previous = compute_features(close, FEATURES)
+    previous.insert(0, 'close', close)
+    revised = close.copy()
+    revised.iloc[35] *= 1.01
+
+    updated = update_features(revised, FEATURES, previous)
+    pd.testing.assert_frame_equal(updated, compute_features(revised, FEATURES))
+
+def test_add_features_round_trip(tmp_path, close):
+    with patch('DataProcessing.process.PROCESSED_DATA_DIR', str(tmp_path)):
+        processor = CoinGeckoProcessor()
+    df = pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': 0.0})
+
+    processor.save_to_csv(processor.add_features(df.iloc[:30], 'BTC', FEATURES), 'BTC')
+    with patch('DataProcessing.features.update_features', wraps=update_features) as mock_update:
+        enriched = processor.add_features(df, 'BTC', FEATURES)
+
+    previous = mock_update.call_args.args[2]
+    assert len(previous) == 30
+    pd.testing.assert_frame_equal(enriched[FEATURES], compute_features(close, FEATURES))
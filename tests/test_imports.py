@@ -0,0 +1,63 @@
+
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = {'pandas', 'numpy', 'requests'}
+
+# Stubs mínimos do QuantConnect para importar o DataReader fora do LEAN
+QUANTCONNECT_STUB = """
+import sys, types
+qc = types.ModuleType('QuantConnect'); qc.TimeZones = types.SimpleNamespace(Utc='UTC')
+data = types.ModuleType('QuantConnect.Data'); data.SubscriptionDataSource = data.BaseData = object
+python = types.ModuleType('QuantConnect.Python'); python.PythonData = object
+sys.modules.update({'QuantConnect': qc, 'QuantConnect.Data': data, 'QuantConnect.Python': python})
+"""
+
+def import_times(statement, stub=QUANTCONNECT_STUB):
+    """Executa a importação com -X importtime e retorna {módulo: cumulativo em us}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', stub + statement],
+        cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout == ""
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+def test_process_import_is_lazy():
+    times = import_times('import DataProcessing.process')
+    assert not HEAVY_MODULES & set(times)
+    assert times['DataProcessing.process'] < 100_000
+
+def test_reader_import_is_lazy():
+    times = import_times('import DataReader')
+    assert not HEAVY_MODULES & set(times)
+    assert 'DataReader.panel' not in times
+    assert times['DataReader'] < 100_000
+
+def test_research_loaders_import_without_lean():
+    times = import_times('from DataReader.panel import load_panel\nfrom DataReader import load_bars', stub='')
+    assert 'DataReader.panel' in times
+    assert 'DataReader.CoinGeckoDataReader' not in times
+
+def test_old_config_keeps_user_settings(tmp_path):
+    # config.py anterior às opções QUOTE_CURRENCIES, FEATURES etc.
+    (tmp_path / "config.py").write_text(
+        "CRYPTO_SYMBOLS = {'BTC': 'bitcoin'}\n"
+        "COINGECKO_BASE_URL = 'https://example.test'\n"
+        "PROCESSED_DATA_DIR = 'meus_dados'\n"
+        "DEFAULT_VS_CURRENCY = 'usd'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', 'import DataProcessing.process as p; '
+                               'print(p.CONFIG_LOADED, p.PROCESSED_DATA_DIR, p.FEATURES, p.CHUNKED_STORAGE)'],
+        cwd=tmp_path, capture_output=True, text=True, check=True,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join([str(tmp_path), PROJECT_DIR])}
+    )
+    assert result.stdout.split() == ['True', 'meus_dados', '[]', 'False']
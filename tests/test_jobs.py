@@ -0,0 +1,129 @@
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+from DataProcessing.jobs import build_tasks, load_spec, run_jobs, schedule, task_key
+from DataProcessing.process import CoinGeckoProcessor
+
+NOW = 1_700_000_000
+
+@pytest.fixture
+def spec_file(tmp_path):
+    spec = {
+        'rate_limit_per_minute': 600,
+        'max_tasks': 3,
+        'jobs': [
+            {'name': 'hot', 'symbols': {'BTC': 'bitcoin', 'ETH': 'ethereum'},
+             'days': 2, 'refresh_minutes': 60, 'priority': 10, 'quota_share': 0.4},
+            {'name': 'tail', 'symbols': {'DOGE': 'dogecoin', 'ADA': 'cardano', 'TON': 'toncoin'},
+             'days': 365, 'refresh_minutes': 1440, 'priority': 1, 'quota_share': 0.4},
+        ]
+    }
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(spec))
+    return str(path)
+
+@pytest.fixture
+def processor(tmp_path):
+    with patch('DataProcessing.process.PROCESSED_DATA_DIR', str(tmp_path / "output")):
+        return CoinGeckoProcessor()
+
+def test_load_spec_requires_symbols_or_top_n(tmp_path):
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps({'jobs': [{'name': 'empty'}]}))
+    with pytest.raises(ValueError):
+        load_spec(str(path))
+
+def test_build_tasks_orders_by_priority_and_staleness(spec_file, processor):
+    spec = load_spec(spec_file)
+    state = {
+        'BTC:auto:': NOW - 30 * 60,   # atualizado há 30 min: não vencido
+        'ADA:auto:': NOW - 3 * 86400,
+        'TON:auto:': NOW - 2 * 86400,
+        'DOGE:auto:': NOW - 10 * 86400,
+    }
+    tasks = build_tasks(spec, processor, state, NOW)
+    assert [task.symbol for task in tasks] == ['ETH', 'DOGE', 'ADA', 'TON']
+
+def test_schedule_respects_quota_share(spec_file, processor):
+    spec = load_spec(spec_file)
+    tasks = build_tasks(spec, processor, {}, NOW)
+
+    selected = schedule(tasks, spec)
+    # 1 tarefa reservada para cada job e 1 de capacidade ociosa, por urgência
+    assert [task.symbol for task in selected] == ['BTC', 'ETH', 'DOGE']
+
+def test_build_tasks_never_share_output_file(tmp_path, processor):
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps({'jobs': [
+        {'name': 'hot', 'symbols': {'BTC': 'bitcoin'}, 'priority': 10},
+        {'name': 'tail', 'top_n': 3, 'resolutions': ['daily']},
+    ]}))
+    top = {'BTC': 'bitcoin', 'ETH': 'ethereum', 'SOL': 'solana'}
+    with patch.object(processor, 'fetch_top_coins', return_value=top):
+        tasks = build_tasks(load_spec(str(path)), processor, {}, NOW)
+
+    assert [(task.job, task.symbol) for task in tasks] == [('hot', 'BTC'), ('tail', 'ETH'), ('tail', 'SOL')]
+    assert tasks[0].output_dir is None
+    assert tasks[1].output_dir == os.path.join(processor.output_dir, 'daily')
+
+def test_run_jobs_saves_quote_currencies(tmp_path, processor):
+    path = tmp_path / "quotes.json"
+    path.write_text(json.dumps({'jobs': [
+        {'name': 'fx', 'symbols': {'BTC': 'bitcoin', 'ETH': 'ethereum'}, 'quote_currencies': ['usd', 'eur']}
+    ]}))
+    raw = [[1672531200000, 16500, 16800, 16400, 16750]]
+    with patch.object(processor, 'fetch_data', return_value=raw) as mock_fetch, \
+         patch.object(processor, 'save_to_csv') as mock_save:
+        run_jobs(str(path), processor=processor, now=NOW)
+
+    # 2 moedas + 1 série de câmbio compartilhada
+    assert mock_fetch.call_count == 3
+    assert [call.args[1] for call in mock_save.call_args_list] == ['BTC', 'BTCEUR', 'ETH', 'ETHEUR']
+
+def test_run_jobs_fetches_fx_rates_per_resolution(tmp_path, processor):
+    path = tmp_path / "quotes.json"
+    path.write_text(json.dumps({'jobs': [
+        {'name': 'fx', 'symbols': {'BTC': 'bitcoin'}, 'days': 365,
+         'resolutions': ['daily', 'hourly'], 'quote_currencies': ['usd', 'eur']}
+    ]}))
+    raw = [[1672531200000, 16500, 16800, 16400, 16750]]
+    with patch.object(processor, 'fetch_data', return_value=raw) as mock_fetch, \
+         patch.object(processor, 'save_to_csv'):
+        run_jobs(str(path), processor=processor, now=NOW)
+
+    fx_calls = [call for call in mock_fetch.call_args_list if call.args[0] == 'tether']
+    assert [call.kwargs for call in fx_calls] == [
+        {'vs_currency': 'eur', 'interval': 'daily'},
+        {'vs_currency': 'eur', 'interval': 'hourly'},
+    ]
+
+def test_run_jobs_updates_state(spec_file, processor):
+    raw = [[1672531200000, 16500, 16800, 16400, 16750]]
+    with patch.object(processor, 'fetch_data', return_value=raw) as mock_fetch:
+        done = run_jobs(spec_file, processor=processor, now=NOW)
+
+    assert len(done) == 3
+    assert processor.request_delay == pytest.approx(0.1)
+    mock_fetch.assert_any_call('bitcoin', 2, interval=None)
+
+    with open(spec_file.replace('.json', '.state.json')) as f:
+        state = json.load(f)
+    assert set(state) == {task_key(task) for task in done}
+    assert run_jobs(spec_file, processor=processor, now=NOW, dry_run=True)[0].symbol == 'ADA'
+
+def test_run_jobs_continues_after_failed_task(spec_file, processor):
+    raw = [[1672531200000, 16500, 16800, 16400, 16750]]
+
+    def fetch(coin_id, days, interval=None):
+        if coin_id == 'bitcoin':
+            raise ValueError("resposta inválida")
+        return raw
+
+    with patch.object(processor, 'fetch_data', side_effect=fetch):
+        done = run_jobs(spec_file, processor=processor, now=NOW)
+
+    assert [task.symbol for task in done] == ['ETH', 'DOGE']
+    with open(spec_file.replace('.json', '.state.json')) as f:
+        assert 'BTC:auto:' not in json.load(f)
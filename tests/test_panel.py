@@ -0,0 +1,49 @@
+
+import numpy as np
+import pytest
+from datetime import datetime
+from DataReader.panel import load_panel
+
+@pytest.fixture
+def data_root(tmp_path):
+    """Fixture com dois símbolos em formatos diferentes."""
+    (tmp_path / "btc").mkdir()
+    (tmp_path / "btc" / "btc.csv").write_text(
+        "1672531200000,16500.0,16800.0,16400.0,16750.0,0\n"
+        "1672617600000,16750.0,17000.0,16600.0,16900.0,0\n"
+    )
+    (tmp_path / "eth").mkdir()
+    (tmp_path / "eth" / "eth.csv").write_text(
+        "20230102 00:00,1200.0,1250.0,1190.0,1220.0,0\n"
+        "20230103 00:00,1220.0,1260.0,1210.0,1240.0,0\n"
+    )
+    return [str(tmp_path)]
+
+def test_load_panel_frame(data_root):
+    panel = load_panel(fields=('open', 'close'), roots=data_root)
+
+    assert list(panel.columns) == [('BTC', 'open'), ('BTC', 'close'), ('ETH', 'open'), ('ETH', 'close')]
+    assert len(panel) == 3
+    assert panel.index[0] == datetime(2023, 1, 1)
+    assert panel[('BTC', 'close')].iloc[1] == 16900.0
+    assert panel[('ETH', 'close')].iloc[1] == 1220.0
+    assert np.isnan(panel[('ETH', 'close')].iloc[0])
+
+def test_load_panel_array_with_date_range(data_root):
+    panel = load_panel(['eth', 'btc'], fields=('close',), start='2023-01-02', end='2023-01-02',
+                       roots=data_root, dtype='float32', as_array=True)
+
+    assert panel.values.shape == (1, 2, 1)
+    assert panel.values.dtype == np.float32
+    assert panel.symbols == ['ETH', 'BTC']
+    assert panel.values[0, :, 0].tolist() == [1220.0, 16900.0]
+
+def test_load_panel_unknown_field(data_root):
+    with pytest.raises(ValueError):
+        load_panel(fields=('vwap',), roots=data_root)
+
+def test_load_panel_empty_date_range(data_root):
+    panel = load_panel(['btc'], fields=('open', 'close'), start='2024-01-01', roots=data_root)
+    assert panel.empty
+    assert list(panel.columns) == [('BTC', 'open'), ('BTC', 'close')]
+    assert load_panel([], roots=data_root).shape == (0, 0)
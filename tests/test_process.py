@@ -40,9 +40,12 @@ def test_process_data(processor, mock_coingecko_response):
     assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
     assert df.shape == (2, 5)
     assert df['volume'].iloc[0] == 0
+    assert df.index.dtype == 'int64'
+    assert df.index[0] == 1672531200000
 
 def test_save_to_csv(processor, tmp_path):
     with patch('DataProcessing.process.PROCESSED_DATA_DIR', str(tmp_path)):
+        processor = CoinGeckoProcessor()
         df = pd.DataFrame({
             'open': [16500.0], 'high': [16800.0], 'low': [16400.0], 'close': [16750.0], 'volume': [0.0]
         }, index=[pd.to_datetime('2023-01-01')])
@@ -55,5 +58,42 @@ def test_save_to_csv(processor, tmp_path):
 
         with open(expected_file, 'r') as f:
             line = f.readline().strip()
-            assert line == "20230101 00:00,16500.0,16800.0,16400.0,16750.0,0.0"
+            assert line == "1672531200000,16500.0,16800.0,16400.0,16750.0,0.0"
 
+
+def test_derive_quote(processor, mock_coingecko_response):
+    df = processor.process_data(mock_coingecko_response, 'BTC')
+    rates = processor.process_fx_rates([
+        [1672531200000, 0.9, 0.9, 0.9, 0.9],
+        [1672617600000, 0.5, 0.5, 0.5, 0.5]
+    ])
+
+    derived = processor.derive_quote(df, rates)
+    assert list(derived.columns) == ['open', 'high', 'low', 'close', 'volume']
+    assert derived['close'].iloc[0] == pytest.approx(16750 * 0.9)
+    assert derived['open'].iloc[1] == pytest.approx(16750 * 0.5)
+    assert derived['volume'].iloc[0] == 0
+
+def test_quote_symbol(processor):
+    assert processor.quote_symbol('BTC', 'usd') == 'BTC'
+    assert processor.quote_symbol('BTC', 'eur') == 'BTCEUR'
+
+def test_process_quotes_fetches_usd_once_per_coin(processor, mock_coingecko_response):
+    with patch.object(processor, 'fetch_data', return_value=mock_coingecko_response) as mock_fetch, \
+         patch.object(processor, 'save_to_csv') as mock_save:
+        saved = processor.process_quotes({'BTC': 'bitcoin', 'ETH': 'ethereum'}, ['usd', 'eur', 'btc'])
+
+    # 2 séries de câmbio + 2 moedas, em vez de 2 x 3 requisições
+    assert mock_fetch.call_count == 4
+    # BTC cotado em BTC é ignorado
+    assert saved == 5
+    saved_symbols = [call.args[1] for call in mock_save.call_args_list]
+    assert saved_symbols == ['BTC', 'BTCEUR', 'ETH', 'ETHEUR', 'ETHBTC']
+
+def test_derive_quote_drops_bars_before_first_rate(processor, mock_coingecko_response):
+    df = processor.process_data(mock_coingecko_response, 'BTC')
+    rates = processor.process_fx_rates([[1672617600000, 0.5, 0.5, 0.5, 0.5]])
+
+    derived = processor.derive_quote(df, rates)
+    assert list(derived.index) == [1672617600000]
+    assert derived['close'].iloc[0] == pytest.approx(16900 * 0.5)
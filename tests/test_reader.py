@@ -46,3 +46,27 @@ def test_reader_malformed_line(data_reader_instance, mock_config):
     data = data_reader_instance.Reader(mock_config, line, datetime.now(), isLiveMode=False)
     assert data is None
 
+
+def test_reader_epoch_line(data_reader_instance, mock_config):
+    """Testa o método Reader com timestamp UTC em milissegundos."""
+    line = "1672531200000,16500.0,16800.0,16400.0,16750.0,0"
+    data = data_reader_instance.Reader(mock_config, line, datetime.now(), isLiveMode=False)
+
+    assert data is not None
+    assert data.Time == datetime(2023, 1, 1)
+    assert data["Close"] == 16750
+
+def test_data_time_zone(data_reader_instance):
+    """Testa se o leitor declara os dados em UTC."""
+    from QuantConnect import TimeZones
+    assert data_reader_instance.DataTimeZone() == TimeZones.Utc
+
+def test_reader_features(data_reader_instance, mock_config):
+    """Testa a leitura dos indicadores pré-calculados."""
+    line = "1672531200000,16500.0,16800.0,16400.0,16750.0,0,sma_2=16700.0,return_1=nan\n"
+    data = data_reader_instance.Reader(mock_config, line, datetime.now(), isLiveMode=False)
+
+    assert data is not None
+    assert data["sma_2"] == 16700.0
+    assert list(data.Features) == ["sma_2", "return_1"]
+    assert data.Features["sma_2"] == 16700.0
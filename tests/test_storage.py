@@ -0,0 +1,80 @@
+
+import os
+import pandas as pd
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from DataProcessing.process import CoinGeckoProcessor
+from DataReader.CoinGeckoDataReader import CoinGeckoData
+from DataReader.panel import load_panel
+
+@pytest.fixture
+def chunked_processor(tmp_path):
+    with patch('DataProcessing.process.PROCESSED_DATA_DIR', str(tmp_path)):
+        processor = CoinGeckoProcessor()
+    processor.chunked = True
+    return processor
+
+@pytest.fixture
+def bars():
+    index = pd.date_range('2023-01-30', periods=5, freq='D')
+    close = [16500.0, 16600.0, 16700.0, 16800.0, 16900.0]
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': 0.0},
+                        index=index)
+
+def chunk_files(tmp_path):
+    return sorted(os.listdir(tmp_path / "btc" / "chunks"))
+
+def test_save_to_csv_writes_monthly_chunks(chunked_processor, bars, tmp_path):
+    chunked_processor.save_to_csv(bars, 'BTC')
+
+    files = chunk_files(tmp_path)
+    assert [name[:6] for name in files] == ['202301', '202302']
+    assert (tmp_path / "btc" / "btc.json").exists()
+    assert not (tmp_path / "btc" / "btc.csv").exists()
+
+def test_rerun_only_writes_changed_chunk(chunked_processor, bars, tmp_path):
+    chunked_processor.save_to_csv(bars, 'BTC')
+    january, february = chunk_files(tmp_path)
+    mtime = os.path.getmtime(tmp_path / "btc" / "btc.json")
+
+    chunked_processor.save_to_csv(bars, 'BTC')
+    assert chunk_files(tmp_path) == [january, february]
+    assert os.path.getmtime(tmp_path / "btc" / "btc.json") == mtime
+
+    bars.loc[bars.index[-1], 'close'] = 17000.0
+    chunked_processor.save_to_csv(bars, 'BTC')
+    files = chunk_files(tmp_path)
+    assert files[0] == january
+    assert files[1] != february
+
+def test_chunks_are_readable(chunked_processor, bars, tmp_path, mock_config):
+    chunked_processor.save_to_csv(bars, 'BTC')
+
+    panel = load_panel(['BTC'], roots=[str(tmp_path)], start='2023-02-01')
+    assert panel[('BTC', 'close')].tolist() == [16700.0, 16800.0, 16900.0]
+
+    cwd = os.getcwd()
+    os.makedirs(tmp_path / "data" / "crypto")
+    os.rename(tmp_path / "btc", tmp_path / "data" / "crypto" / "btc")
+    try:
+        os.chdir(tmp_path)
+        source = CoinGeckoData().GetSource(mock_config, datetime(2023, 2, 2), isLiveMode=False)
+    finally:
+        os.chdir(cwd)
+    assert source.Source.startswith("data/crypto/btc/chunks/202302-")
+
+def test_switching_storage_mode_removes_stale_layout(chunked_processor, bars, tmp_path):
+    chunked_processor.save_to_csv(bars, 'BTC')
+
+    bars['close'] = 2.0
+    chunked_processor.chunked = False
+    chunked_processor.save_to_csv(bars, 'BTC')
+    assert not (tmp_path / "btc" / "btc.json").exists()
+    assert not (tmp_path / "btc" / "chunks").exists()
+    assert chunked_processor.stored_files('BTC') == [str(tmp_path / "btc" / "btc.csv")]
+    assert load_panel(['BTC'], roots=[str(tmp_path)])[('BTC', 'close')].tolist() == [2.0] * 5
+
+    chunked_processor.chunked = True
+    chunked_processor.save_to_csv(bars, 'BTC')
+    assert not (tmp_path / "btc" / "btc.csv").exists()
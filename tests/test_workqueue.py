@@ -0,0 +1,109 @@
+
+import json
+import multiprocessing
+import os
+import pytest
+from unittest.mock import patch
+from DataProcessing.jobs import Task
+from DataProcessing.process import CoinGeckoProcessor
+from DataProcessing.workqueue import WorkQueue, enqueue_spec, run_worker
+
+COINS = {'BTC': 'bitcoin', 'ETH': 'ethereum', 'SOL': 'solana', 'BNB': 'binancecoin', 'ADA': 'cardano', 'XRP': 'xrp'}
+
+def make_tasks(coins=COINS):
+    return [Task('backfill', symbol, coin_id, 365, None, None, 0, 0.0) for symbol, coin_id in coins.items()]
+
+@pytest.fixture
+def queue_path(tmp_path):
+    path = str(tmp_path / "queue.db")
+    queue = WorkQueue(path)
+    queue.enqueue(make_tasks())
+    queue.close()
+    return path
+
+def test_claim_is_exclusive_and_stale_leases_are_reclaimed(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.db"), lease_seconds=60)
+    queue.enqueue(make_tasks({'BTC': 'bitcoin', 'ETH': 'ethereum'}))
+    first = queue.claim('a', now=1000)
+    second = queue.claim('b', now=1000)
+    assert first[0] != second[0]
+    assert queue.claim('c', now=1000) is None
+
+    # 'b' continua renovando o lease; 'a' para e sua tarefa é reassumida
+    assert queue.heartbeat(first[0], 'a', now=1030)
+    assert queue.heartbeat(second[0], 'b', now=1080)
+    assert queue.claim('c', now=1080) is None
+    reclaimed = queue.claim('c', now=1100)
+    assert reclaimed[0] == first[0]
+    assert not queue.heartbeat(first[0], 'a')
+    assert not queue.complete(first[0], 'a')
+    assert queue.complete(first[0], 'c')
+    queue.close()
+
+def test_expired_lease_after_max_attempts_fails(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.db"), lease_seconds=60, max_attempts=2)
+    queue.enqueue(make_tasks({'BTC': 'bitcoin'}))
+    # Cada worker para sem concluir nem chamar fail (ex: processo encerrado)
+    assert queue.claim('a', now=1000) is not None
+    assert queue.claim('b', now=1100) is not None
+    assert queue.claim('c', now=1200) is None
+    assert queue.counts() == {'failed': 1}
+    queue.close()
+
+def test_enqueue_reopens_only_finished_tasks(queue_path):
+    queue = WorkQueue(queue_path)
+    key, _ = queue.claim('a')
+    queue.complete(key, 'a')
+    assert queue.enqueue(make_tasks()) == 1
+    assert queue.counts() == {'pending': len(COINS)}
+    queue.close()
+
+def test_enqueue_spec_skips_recently_completed_tasks(tmp_path):
+    spec_path = tmp_path / "jobs.json"
+    spec_path.write_text(json.dumps({'jobs': [
+        {'name': 'hot', 'symbols': {'BTC': 'bitcoin', 'ETH': 'ethereum'}, 'refresh_minutes': 60}
+    ]}))
+    path = str(tmp_path / "queue.db")
+    assert enqueue_spec(str(spec_path), path) == 2
+
+    queue = WorkQueue(path)
+    key, _ = queue.claim('a')
+    queue.complete(key, 'a')
+    assert enqueue_spec(str(spec_path), path) == 0
+    assert queue.counts() == {'done': 1, 'pending': 1}
+
+    # Concluída há mais de um período: volta a ficar vencida
+    queue.conn.execute("UPDATE tasks SET updated = updated - 7200 WHERE key = ?", (key,))
+    assert enqueue_spec(str(spec_path), path) == 1
+    assert queue.counts() == {'pending': 2}
+    queue.close()
+
+def worker_main(queue_path, worker_id, output_dir):
+    """Worker de teste: dados fixos em vez de requisições à API."""
+    with patch('DataProcessing.process.PROCESSED_DATA_DIR', output_dir):
+        processor = CoinGeckoProcessor()
+    raw = [[1672531200000, 16500, 16800, 16400, 16750]]
+    with patch.object(processor, 'fetch_data', return_value=raw):
+        run_worker(queue_path, worker_id, rate_limit_per_minute=6000, processor=processor)
+
+def test_multiple_processes_share_the_queue(queue_path, tmp_path):
+    try:
+        context = multiprocessing.get_context('fork')
+    except ValueError:
+        pytest.skip("fork indisponível nesta plataforma")
+
+    output_dir = str(tmp_path / "output")
+    workers = [context.Process(target=worker_main, args=(queue_path, f"w{i}", output_dir)) for i in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    queue = WorkQueue(queue_path)
+    assert queue.counts() == {'done': len(COINS)}
+    attempts = queue.conn.execute("SELECT SUM(attempts) FROM tasks").fetchone()[0]
+    queue.close()
+    assert attempts == len(COINS)
+    for symbol in COINS:
+        assert os.path.exists(os.path.join(output_dir, symbol.lower(), f"{symbol.lower()}.csv"))